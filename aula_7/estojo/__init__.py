@@ -1,10 +1,26 @@
-from .lapis import Lapis
-from .borracha import Borracha
+# Nada é executado na importação do pacote: as classes e as funções
+# escrever/apagar são criadas no primeiro acesso a qualquer um desses nomes.
+_NOMES = ('Lapis', 'Borracha', 'lapis', 'escrever', 'borracha', 'apagar')
 
-print("Importando estojo...")
 
-lapis = Lapis()
-escrever = lapis.escrever
+def _carregar():
+    from .lapis import Lapis
+    from .borracha import Borracha
 
-borracha = Borracha()
-apagar = borracha.apagar
\ No newline at end of file
+    lapis = Lapis()
+    borracha = Borracha()
+    globals().update(
+        Lapis=Lapis,
+        Borracha=Borracha,
+        lapis=lapis,
+        escrever=lapis.escrever,
+        borracha=borracha,
+        apagar=borracha.apagar,
+    )
+
+
+def __getattr__(nome):
+    if nome in _NOMES:
+        _carregar()
+        return globals()[nome]
+    raise AttributeError(f'module {__name__!r} has no attribute {nome!r}')
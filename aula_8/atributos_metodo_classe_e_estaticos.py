@@ -155,10 +155,10 @@ a = 2
 
 from datetime import date
 from sys import exception
-from typing import List
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_registro_cpf import RegistroCpf
 
 class Titular:
-    cpfs_utilizados: List[str] = []
+    cpfs_utilizados: RegistroCpf = RegistroCpf()
     def __init__(self, nome: str, cpf: str, dt_nasc: date):
         if self.cpf_ja_utilizado(cpf):
             return
@@ -192,24 +192,26 @@ class Titular:
 
     @classmethod
     def adicionar_cpf(cls, cpf):
-        cls.cpfs_utilizados.append(cpf)
+        cls.cpfs_utilizados.adicionar(cpf)
 
     @classmethod
     def listar_cpfs(cls):
-      print(cls.cpfs_utilizados)
+      yield from cls.cpfs_utilizados
 
 
 cpf = '12345678900'
 dt_nasc = date(year=1991, month=8, day=6)
 t1 = Titular('Pedro', cpf, dt_nasc)
-t1.listar_cpfs()
+for cpf_cadastrado in t1.listar_cpfs():
+    print(cpf_cadastrado)
 
 print()
 cpf = '98765432100'
 dt_nasc = date(year=1995, month=6, day=20)
 t2 = Titular('Laura', cpf, dt_nasc)
 
-t2.listar_cpfs()
+for cpf_cadastrado in t2.listar_cpfs():
+    print(cpf_cadastrado)
 
 ########################################################################################################
 
@@ -238,10 +240,11 @@ t2.listar_cpfs()
 
 from datetime import date
 from sys import exception
-from typing import List
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_registro_cpf import RegistroCpf
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_cpf import cpf_valido
 
 class Titular:
-    cpfs_utilizados: List[str] = []
+    cpfs_utilizados: RegistroCpf = RegistroCpf()
     def __init__(self, nome: str = None, cpf: str = None, dt_nasc: date = None):
         if self.cpf_ja_utilizado(cpf):
             return
@@ -276,25 +279,23 @@ class Titular:
 
     @classmethod
     def adicionar_cpf(cls, cpf):
-        cls.cpfs_utilizados.append(cpf)
+        cls.cpfs_utilizados.adicionar(cpf)
     
     @classmethod
     def listar_cpfs(cls):
-      print(cls.cpfs_utilizados)
+      yield from cls.cpfs_utilizados
     
     @staticmethod
     def validar_cpf(cpf: str):
-        if cpf and len(cpf) == 11:
-            return True
-        else:
-            return False
+        # 11 dígitos e dígitos verificadores (módulo 11) corretos
+        return bool(cpf) and cpf_valido(cpf)
 
 
 # cpf1 = '40040040047'
 # dt_nasc = date(year=1991, month=8, day=6)
 # t1 = Titular(nome='Pedro', cpf=cpf1, dt_nasc=dt_nasc)
 
-cpf2 = '40040040983'
+cpf2 = '52998224725'
 print(Titular.validar_cpf(cpf2))
 cpf3 = '400400409883'
 print(Titular.validar_cpf(cpf3))
\ No newline at end of file
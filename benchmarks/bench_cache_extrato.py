@@ -0,0 +1,54 @@
+# Benchmark do cache de extratos renderizados (modulo_cache_extrato): uma
+# conta com muitos movimentos, renderizada sem cache, na primeira vez com
+# cache, de novo sem mudanças e depois de cada novo movimento.
+#
+# Uso (a partir da raiz do repositório):
+#   python benchmarks/bench_cache_extrato.py [movimentos] [atualizacoes]
+
+import io
+import os
+import sys
+from datetime import date
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas import ContaCorrente
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_cache_extrato import CacheExtratos
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+
+def cronometrar(nome: str, funcao, repeticoes: int) -> None:
+    inicio = perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    duracao = (perf_counter() - inicio) / repeticoes
+    print(f'{nome:>34}: {duracao * 1e3:>10.3f} ms por extrato')
+
+
+def main() -> None:
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    atualizacoes = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    titular = Titular('Benchmark', '00000000000', date(year=1991, month=8, day=6))
+    conta = ContaCorrente(titular, '0001', '00001')
+    conta.aplicar_lote([('deposito', 10.0)] * quantidade)
+    print(f'Movimentos: {quantidade}')
+
+    Conta.definir_cache_extratos(None)
+    cronometrar('sem cache', lambda: conta.extrato(io.StringIO()), 3)
+
+    cache = CacheExtratos()
+    Conta.definir_cache_extratos(cache)
+    cronometrar('com cache, primeira vez', lambda: conta.extrato(io.StringIO()), 1)
+    cronometrar('com cache, sem mudanças', lambda: conta.extrato(io.StringIO()), atualizacoes)
+
+    def novo_movimento_e_extrato():
+        conta.deposito(1.0)
+        conta.extrato(io.StringIO())
+    cronometrar('com cache, 1 movimento novo', novo_movimento_e_extrato, atualizacoes)
+    print(f'{"tamanho do cache":>34}: {cache.tamanho / 1e6:>10.1f} M caracteres')
+
+
+if __name__ == '__main__':
+    main()
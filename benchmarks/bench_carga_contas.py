@@ -0,0 +1,63 @@
+# Benchmark da importação em lote (modulo_importacao): gera um CSV de
+# titulares e contas, importa e mostra linhas/s, rejeições e pico de memória.
+#
+# Uso (a partir da raiz do repositório):
+#   python benchmarks/bench_carga_contas.py [linhas] [tamanho_bloco]
+
+import csv
+import os
+import random
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_importacao import importar_csv
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_repositorio import RepositorioContas
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_cpf import digitos_verificadores
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_registro_cpf import RegistroCpf
+
+
+def gerar_cpf(gerador: random.Random) -> str:
+    base = f'{gerador.randrange(10 ** 9):09d}'
+    return base + digitos_verificadores(base)
+
+
+def gerar_csv(caminho: str, linhas: int) -> None:
+    # ~1% de CPFs malformados e ~5% de titulares com uma segunda conta
+    gerador = random.Random(42)
+    with open(caminho, 'w', newline='', encoding='utf-8') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(['nome', 'cpf', 'data_nascimento', 'agencia', 'conta', 'tipo'])
+        anterior = gerar_cpf(gerador)
+        for indice in range(linhas):
+            sorteio = gerador.random()
+            if sorteio < 0.01:
+                cpf = gerar_cpf(gerador)[:9]
+            elif sorteio < 0.06:
+                cpf = anterior
+            else:
+                cpf = anterior = gerar_cpf(gerador)
+            tipo = 'poupanca' if gerador.random() < 0.3 else 'corrente'
+            escritor.writerow([f'Titular {indice}', cpf, '1991-08-06', f'{indice % 500:04d}', f'{indice:08d}', tipo])
+
+
+def main() -> None:
+    linhas = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    tamanho_bloco = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    with tempfile.TemporaryDirectory() as diretorio:
+        caminho = os.path.join(diretorio, 'contas.csv')
+        gerar_csv(caminho, linhas)
+        print(f'Arquivo: {linhas} linhas, {os.path.getsize(caminho) / 2 ** 20:.1f} MiB')
+        registro = RegistroCpf()
+        relatorio = importar_csv(caminho, RepositorioContas(), registro, tamanho_bloco=tamanho_bloco)
+    print(f'Importadas: {relatorio.importadas}  titulares: {len(registro)}')
+    for motivo, quantidade in sorted(relatorio.rejeitadas.items()):
+        print(f'  rejeitadas ({motivo}): {quantidade}')
+    print(f'Tempo: {relatorio.segundos:.2f} s  ({relatorio.linhas_por_segundo:.0f} linhas/s)')
+    if relatorio.pico_memoria_bytes is not None:
+        print(f'Pico de memória do processo: {relatorio.pico_memoria_bytes / 2 ** 20:.1f} MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+# Benchmark da conciliação (modulo_conciliacao): gera transferências entre
+# muitas contas, concilia e projeta o tempo para um dia de 50 milhões de
+# movimentos.
+#
+# Uso (a partir da raiz do repositório):
+#   python benchmarks/bench_conciliacao.py [transferencias] [contas] [particoes]
+
+import os
+import random
+import sys
+from datetime import date
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas import ContaCorrente
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_conciliacao import conciliar
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+MOVIMENTOS_DIA = 50_000_000
+
+
+def main() -> None:
+    quantidade_transferencias = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    quantidade_contas = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    particoes = int(sys.argv[3]) if len(sys.argv) > 3 else 1
+
+    titular = Titular('Benchmark', '00000000000', date(year=1991, month=8, day=6))
+    contas = [ContaCorrente(titular, '0001', f'{i:06d}') for i in range(quantidade_contas)]
+    for conta in contas:
+        conta.deposito(1_000_000.0)
+    gerador = random.Random(42)
+    inicio = perf_counter()
+    for _ in range(quantidade_transferencias):
+        origem, destino = gerador.sample(contas, 2)
+        origem.transferencia(1.0, destino)
+    print(f'Geração: {quantidade_transferencias} transferências em {perf_counter() - inicio:.1f} s')
+
+    inicio = perf_counter()
+    relatorio = conciliar(contas, particoes=particoes)
+    duracao = perf_counter() - inicio
+    taxa = relatorio.movimentos / duracao
+    print(f'Movimentos: {relatorio.movimentos}  transferências conciliadas: {relatorio.transferencias}  '
+          f'divergências: {len(relatorio.divergencias)}')
+    print(f'Conciliação ({particoes} partição(ões)): {duracao:.2f} s  ({taxa:.0f} movimentos/s)')
+    print(f'Projeção para {MOVIMENTOS_DIA} movimentos: {MOVIMENTOS_DIA / taxa / 60:.1f} min')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+# Benchmark do diário (write-ahead log): movimentos e fsyncs por segundo com
+# diferentes tamanhos de grupo no group commit.
+#
+# Uso (a partir da raiz do repositório):
+#   python benchmarks/bench_diario.py [quantidade_de_movimentos]
+
+import os
+import sys
+import tempfile
+from datetime import date
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas import ContaCorrente
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_diario import DiarioContas
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+TAMANHOS_GRUPO = (1, 10, 100, 1000)
+
+
+def medir(tamanho_grupo: int, quantidade: int) -> None:
+    with tempfile.TemporaryDirectory() as diretorio:
+        diario = DiarioContas(diretorio, tamanho_grupo=tamanho_grupo)
+        Conta.definir_diario(diario)
+        titular = Titular('Benchmark', '00000000000', date(year=1991, month=8, day=6))
+        conta = ContaCorrente(titular, '0001', '00001')
+        inicio = perf_counter()
+        for _ in range(quantidade):
+            conta.deposito(1.0)
+        diario.fechar()
+        duracao = perf_counter() - inicio
+        Conta.definir_diario(None)
+    fsyncs = -(-quantidade // tamanho_grupo)
+    print(f'grupo {tamanho_grupo:>5}: {quantidade / duracao:>10.0f} movimentos/s  {fsyncs / duracao:>8.0f} fsyncs/s')
+
+
+def main() -> None:
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    Conta.definir_notificador(None)
+    print(f'Movimentos: {quantidade}')
+    for tamanho_grupo in TAMANHOS_GRUPO:
+        medir(tamanho_grupo, quantidade)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+# Benchmark: soma, comparação e juros sobre muitos valores, com laço de Drex
+# versus DrexArray (requer NumPy).
+#
+# Uso (a partir da raiz do repositório):
+#   python benchmarks/bench_drex_array.py [quantidade_de_valores]
+
+import os
+import random
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos_e_pacotes.biblioteca_contas.pacote_drex import Drex
+from modulos_e_pacotes.biblioteca_contas.pacote_drex.modulo_drex_array import DrexArray
+
+
+def cronometrar(nome: str, funcao) -> None:
+    inicio = perf_counter()
+    funcao()
+    print(f'{nome:>28}: {perf_counter() - inicio:8.4f} s')
+
+
+def main() -> None:
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    gerador = random.Random(42)
+    valores = [Drex.de_centavos(gerador.randrange(0, 1_000_000)) for _ in range(quantidade)]
+    vetor = DrexArray(valores)
+    limite = Drex(5000)
+    print(f'Valores: {quantidade}')
+
+    def soma_laco():
+        total = Drex(0)
+        for valor in valores:
+            total = total + valor
+        return total
+
+    cronometrar('soma (laço de Drex)', soma_laco)
+    cronometrar('soma (DrexArray)', vetor.soma)
+    cronometrar('acima do limite (laço)', lambda: [valor for valor in valores if valor > limite])
+    cronometrar('acima do limite (máscara)', lambda: vetor[vetor > limite])
+    cronometrar('juros 1% (laço)', lambda: [valor * 0.01 for valor in valores])
+    cronometrar('juros 1% (DrexArray)', lambda: vetor * 0.01)
+
+
+if __name__ == '__main__':
+    main()
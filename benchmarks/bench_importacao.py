@@ -0,0 +1,69 @@
+# Benchmark do tempo de importação, medido com `python -X importtime` em um
+# interpretador novo a cada execução. Termina com código 1 se algum alvo
+# passar do limite, para servir de proteção contra regressões no tempo de
+# inicialização.
+#
+# Uso (a partir da raiz do repositório):
+#   python benchmarks/bench_importacao.py [execucoes] [limite_ms]
+
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# nome exibido -> código executado no interpretador novo
+ALVOS = {
+    'pacote_contas': 'import modulos_e_pacotes.biblioteca_contas.pacote_contas',
+    'pacote_drex': 'import modulos_e_pacotes.biblioteca_contas.pacote_drex',
+    'pacote_titulares': 'import modulos_e_pacotes.biblioteca_contas.pacote_titulares',
+    'ContaCorrente': 'from modulos_e_pacotes.biblioteca_contas.pacote_contas import ContaCorrente',
+    'Drex': 'from modulos_e_pacotes.biblioteca_contas.pacote_drex import Drex',
+}
+
+
+def tempo_importacao_us(codigo: str) -> int:
+    # Soma o tempo próprio (self) de todos os módulos importados pelo código,
+    # ignorando os que o interpretador já carrega na inicialização.
+    base = _tempos_por_modulo('pass')
+    tempos = _tempos_por_modulo(codigo)
+    return sum(tempo for modulo, tempo in tempos.items() if modulo not in base)
+
+
+def _tempos_por_modulo(codigo: str) -> Dict[str, int]:
+    ambiente = dict(os.environ, PYTHONPATH=RAIZ)
+    processo = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', codigo],
+        cwd=RAIZ, env=ambiente, capture_output=True, text=True, check=True,
+    )
+    tempos = {}
+    for linha in processo.stderr.splitlines():
+        # formato: "import time:  self [us] | cumulative | imported package"
+        if not linha.startswith('import time:') or 'self [us]' in linha:
+            continue
+        proprio, _, modulo = linha[len('import time:'):].split('|')
+        tempos[modulo.strip()] = int(proprio)
+    return tempos
+
+
+def main() -> None:
+    execucoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    limite_ms = float(sys.argv[2]) if len(sys.argv) > 2 else 60.0
+    acima_do_limite = []
+    for nome, codigo in ALVOS.items():
+        medidas = [tempo_importacao_us(codigo) for _ in range(execucoes)]
+        mediana_ms = statistics.median(medidas) / 1000
+        marca = ''
+        if mediana_ms > limite_ms:
+            acima_do_limite.append(nome)
+            marca = '  <-- acima do limite'
+        print(f'{nome:>18}: {mediana_ms:7.2f} ms (mediana de {execucoes}){marca}')
+    if acima_do_limite:
+        print(f'Limite de {limite_ms} ms excedido: {", ".join(acima_do_limite)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
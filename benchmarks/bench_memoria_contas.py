@@ -0,0 +1,54 @@
+# Benchmark de memória: bytes por conta mantida em memória.
+#
+# Uso (a partir da raiz do repositório):
+#   python benchmarks/bench_memoria_contas.py [quantidade_de_contas]
+
+import gc
+import os
+import sys
+import tracemalloc
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas import ContaCorrente
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+
+# Subclasses sem __slots__ ganham um __dict__ por instância, como as classes das aulas 5 e 6
+class TitularComDict(Titular):
+    pass
+
+
+class ContaCorrenteComDict(ContaCorrente):
+    pass
+
+
+def medir(classe_titular, classe_conta, quantidade: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    dt_nasc = date(year=1991, month=8, day=6)
+    contas = []
+    for i in range(quantidade):
+        titular = classe_titular('Titular', f'{i:011d}', dt_nasc)
+        contas.append(classe_conta(titular, '0001', f'{i:08d}'))
+    memoria_atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del contas
+    gc.collect()
+    return memoria_atual / quantidade
+
+
+def main() -> None:
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    print(f'Contas: {quantidade}')
+    for nome, classe_titular, classe_conta in (
+        ('com __dict__', TitularComDict, ContaCorrenteComDict),
+        ('com __slots__', Titular, ContaCorrente),
+    ):
+        bytes_por_conta = medir(classe_titular, classe_conta, quantidade)
+        print(f'{nome:>14}: {bytes_por_conta:8.1f} bytes/conta')
+
+
+if __name__ == '__main__':
+    main()
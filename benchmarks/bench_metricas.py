@@ -0,0 +1,58 @@
+# Custo da instrumentação (modulo_metricas) nas operações das contas: o mesmo
+# laço sem métricas, com métricas e depois de desligá-las (deve voltar ao
+# custo original), mais os percentis medidos e o tempo de exportação.
+#
+# Uso (a partir da raiz do repositório):
+#   python benchmarks/bench_metricas.py [quantidade_de_operacoes]
+
+import io
+import os
+import sys
+from datetime import date
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas import ContaCorrente
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_metricas import MetricasContas
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+
+def cronometrar(nome: str, quantidade: int) -> None:
+    titular = Titular('Benchmark', '00000000000', date(year=1991, month=8, day=6))
+    origem = ContaCorrente(titular, '0001', '00001')
+    destino = ContaCorrente(titular, '0001', '00002')
+    deposito, transferencia = origem.deposito, origem.transferencia
+    faixa = range(quantidade)
+    inicio = perf_counter()
+    for _ in faixa:
+        deposito(20.0)
+        transferencia(10.0, destino)
+    duracao = perf_counter() - inicio
+    print(f'{nome:>24}: {duracao / (2 * quantidade) * 1e9:>8.0f} ns/op')
+
+
+def main() -> None:
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f'Operações: {2 * quantidade} (deposito + transferencia)')
+    cronometrar('sem métricas', quantidade)
+
+    metricas = MetricasContas()
+    Conta.definir_metricas(metricas)
+    cronometrar('com métricas', quantidade)
+    Conta.definir_metricas(None)
+    cronometrar('métricas desligadas', quantidade)
+
+    for operacao in ('deposito', 'transferencia'):
+        latencia = metricas.latencia(operacao)
+        percentis = '  '.join(f'p{p:g}={latencia.percentil(p)}' for p in (50, 90, 99, 99.9))
+        print(f'{operacao:>24}: {percentis} ns  max={latencia.maximo_ns} ns')
+
+    inicio = perf_counter()
+    metricas.exportar_prometheus(io.StringIO())
+    print(f'{"exportar_prometheus":>24}: {(perf_counter() - inicio) * 1e3:>8.2f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+# Benchmark de escalabilidade do MotorContasShards: vazão de depósitos e
+# saques em lote com 1 até N processos, comparada à mesma carga em um único
+# interpretador. Também mede transferências entre shards (duas fases).
+#
+# Uso (a partir da raiz do repositório):
+#   python benchmarks/bench_motor_shards.py [max_shards] [contas] [operacoes]
+
+import os
+import random
+import sys
+from datetime import date
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas import ContaCorrente
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_motor_shards import MotorContasShards
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+TAMANHO_LOTE = 20_000
+TRANSFERENCIAS = 2_000
+
+
+def gerar_operacoes(numeros, quantidade):
+    gerador = random.Random(42)
+    return [(gerador.choice(('deposito', 'saque')), '0001', gerador.choice(numeros), 10.0) for _ in range(quantidade)]
+
+
+def medir_local(titular, numeros, operacoes) -> float:
+    # Referência: mesma carga, agrupada por conta, em um único processo
+    contas = {numero: ContaCorrente(titular, '0001', numero) for numero in numeros}
+    inicio = perf_counter()
+    for parte in range(0, len(operacoes), TAMANHO_LOTE):
+        grupos = {}
+        for operacao, _, numero, valor in operacoes[parte:parte + TAMANHO_LOTE]:
+            grupos.setdefault(numero, []).append((operacao, valor))
+        for numero, movimentos in grupos.items():
+            contas[numero].aplicar_lote(movimentos)
+    return len(operacoes) / (perf_counter() - inicio)
+
+
+def medir_shards(quantidade_shards, titular, numeros, operacoes):
+    with MotorContasShards(quantidade_shards) as motor:
+        for numero in numeros:
+            motor.abrir_conta(ContaCorrente, titular, '0001', numero)
+        inicio = perf_counter()
+        for parte in range(0, len(operacoes), TAMANHO_LOTE):
+            motor.executar_lote(operacoes[parte:parte + TAMANHO_LOTE])
+        vazao = len(operacoes) / (perf_counter() - inicio)
+
+        gerador = random.Random(7)
+        inicio = perf_counter()
+        for _ in range(TRANSFERENCIAS):
+            origem, destino = gerador.sample(numeros, 2)
+            motor.transferencia(('0001', origem), ('0001', destino), 1.0)
+        transferencias = TRANSFERENCIAS / (perf_counter() - inicio)
+    return vazao, transferencias
+
+
+def main() -> None:
+    maximo_shards = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 1)
+    quantidade_contas = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    quantidade_operacoes = int(sys.argv[3]) if len(sys.argv) > 3 else 1_000_000
+
+    titular = Titular('Benchmark', '00000000000', date(year=1991, month=8, day=6))
+    numeros = [f'{i:06d}' for i in range(quantidade_contas)]
+    operacoes = gerar_operacoes(numeros, quantidade_operacoes)
+    print(f'Contas: {quantidade_contas}  operações: {quantidade_operacoes}  núcleos: {os.cpu_count()}')
+
+    referencia = medir_local(titular, numeros, operacoes)
+    print(f'{"1 processo (sem motor)":>24}: {referencia:>10.0f} ops/s')
+    for quantidade_shards in range(1, maximo_shards + 1):
+        vazao, transferencias = medir_shards(quantidade_shards, titular, numeros, operacoes)
+        print(f'{f"{quantidade_shards} shard(s)":>24}: {vazao:>10.0f} ops/s  '
+              f'({vazao / referencia:4.2f}x)  {transferencias:>8.0f} transferências/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+# Microbenchmarks de cada operação das contas (pacote_contas): operações por
+# segundo e custo médio por chamada, sem notificador nem diário.
+#
+# Uso (a partir da raiz do repositório):
+#   python benchmarks/bench_operacoes_contas.py [quantidade_de_operacoes]
+
+import io
+import os
+import sys
+from datetime import date
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas import ContaCorrente, ContaPoupanca
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+TAMANHO_LOTE = 100
+
+
+def nova_conta(classe, saldo_inicial: float = 0.0):
+    titular = Titular('Benchmark', '00000000000', date(year=1991, month=8, day=6))
+    conta = classe(titular, '0001', '00001')
+    if saldo_inicial:
+        conta.deposito(saldo_inicial)
+    return conta
+
+
+def cronometrar(nome: str, funcao, quantidade: int) -> None:
+    # `funcao` executa as `quantidade` operações
+    inicio = perf_counter()
+    funcao()
+    duracao = perf_counter() - inicio
+    print(f'{nome:>28}: {quantidade / duracao:>12.0f} ops/s  {duracao / quantidade * 1e9:>8.0f} ns/op')
+
+
+def main() -> None:
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    faixa = range(quantidade)
+    print(f'Operações: {quantidade}')
+
+    corrente = nova_conta(ContaCorrente)
+    deposito = corrente.deposito
+    cronometrar('ContaCorrente.deposito', lambda: [deposito(10.0) for _ in faixa], quantidade)
+
+    corrente = nova_conta(ContaCorrente, quantidade * 10.0)
+    saque = corrente.saque
+    cronometrar('ContaCorrente.saque', lambda: [saque(10.0) for _ in faixa], quantidade)
+
+    corrente = nova_conta(ContaCorrente, quantidade * 10.0)
+    pagamento = corrente.pagamento
+    cronometrar('ContaCorrente.pagamento', lambda: [pagamento(10.0) for _ in faixa], quantidade)
+
+    corrente = nova_conta(ContaCorrente, quantidade * 10.0)
+    destino = nova_conta(ContaCorrente)
+    transferencia = corrente.transferencia
+    cronometrar('ContaCorrente.transferencia', lambda: [transferencia(10.0, destino) for _ in faixa], quantidade)
+
+    # Com chave de idempotência: chaves novas e depois a repetição de todas
+    corrente = nova_conta(ContaCorrente)
+    chaves = [f'requisicao-{i}' for i in faixa]
+    cronometrar('deposito com chave nova', lambda: [corrente.deposito(10.0, chave) for chave in chaves], quantidade)
+    cronometrar('deposito repetido (chave)', lambda: [corrente.deposito(10.0, chave) for chave in chaves], quantidade)
+
+    corrente = nova_conta(ContaCorrente, 1.0)
+    cronometrar('saque recusado (sem saldo)', lambda: [corrente.saque(10.0) for _ in faixa], quantidade)
+
+    poupanca = nova_conta(ContaPoupanca, quantidade * 10.0)
+    saque = poupanca.saque
+    cronometrar('ContaPoupanca.saque', lambda: [saque(10.0) for _ in faixa], quantidade)
+    cronometrar('ContaPoupanca.saque (> limite)', lambda: [saque(150.0) for _ in faixa], quantidade)
+
+    corrente = nova_conta(ContaCorrente, quantidade * 10.0)
+    lote = [('deposito', 10.0), ('saque', 10.0)] * (TAMANHO_LOTE // 2)
+    lotes = range(quantidade // TAMANHO_LOTE)
+    cronometrar(f'aplicar_lote ({TAMANHO_LOTE} movimentos)',
+                lambda: [corrente.aplicar_lote(lote) for _ in lotes], len(lotes) * TAMANHO_LOTE)
+
+    consultas = nova_conta(ContaCorrente, 10.0)
+    cronometrar('saldo', lambda: [consultas.saldo for _ in faixa], quantidade)
+
+    # extrato de uma conta com `quantidade` movimentos, contado por movimento
+    corrente = nova_conta(ContaCorrente)
+    corrente.aplicar_lote([('deposito', 10.0)] * quantidade)
+    cronometrar('extrato (por movimento)', lambda: corrente.extrato(io.StringIO()), quantidade)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+# Benchmark da validação de CPF (modulo_cpf): laço com cpf_valido (com e sem
+# cache) versus validar_cpfs vetorizado com NumPy.
+#
+# Uso (a partir da raiz do repositório):
+#   python benchmarks/bench_validacao_cpf.py [quantidade_de_cpfs]
+
+import os
+import sys
+from time import perf_counter
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_cpf import TAMANHO_CACHE, cpf_valido, validar_cpfs
+
+REPETICOES_CACHE = 10
+
+
+def gerar_cpfs(quantidade: int):
+    # Metade com dígitos verificadores corretos, metade com dígitos aleatórios
+    gerador = np.random.default_rng(42)
+    digitos = gerador.integers(0, 10, size=(quantidade, 11), dtype=np.int64)
+    primeiro = (digitos[:, :9] @ np.arange(10, 1, -1)) * 10 % 11 % 10
+    segundo = (digitos[:, :9] @ np.arange(11, 2, -1) + primeiro * 2) * 10 % 11 % 10
+    metade = quantidade // 2
+    digitos[:metade, 9] = primeiro[:metade]
+    digitos[:metade, 10] = segundo[:metade]
+    texto = (digitos + 48).astype(np.uint8).tobytes().decode('ascii')
+    return [texto[inicio:inicio + 11] for inicio in range(0, len(texto), 11)]
+
+
+def cronometrar(nome: str, funcao, quantidade: int):
+    inicio = perf_counter()
+    resultado = funcao()
+    duracao = perf_counter() - inicio
+    print(f'{nome:>32}: {duracao:8.3f} s  {quantidade / duracao:>12.0f} CPFs/s')
+    return resultado
+
+
+def main() -> None:
+    quantidade = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+    cpfs = gerar_cpfs(quantidade)
+    print(f'CPFs: {quantidade}')
+
+    validar_sem_cache = cpf_valido.__wrapped__
+    laco = cronometrar('laço (sem cache)', lambda: [validar_sem_cache(cpf) for cpf in cpfs], quantidade)
+    vetorizado = cronometrar('validar_cpfs (NumPy)', lambda: validar_cpfs(cpfs), quantidade)
+    assert laco == vetorizado.tolist()
+    print(f'{"válidos":>32}: {int(vetorizado.sum())}')
+
+    # Consultas repetidas de um conjunto que cabe no cache
+    repetidos = cpfs[:TAMANHO_CACHE] * REPETICOES_CACHE
+    cpf_valido.cache_clear()
+    cronometrar('cpf_valido (consultas repetidas)', lambda: [cpf_valido(cpf) for cpf in repetidos], len(repetidos))
+    print(f'{"acertos de cache":>32}: {cpf_valido.cache_info().hits}')
+
+
+if __name__ == '__main__':
+    main()
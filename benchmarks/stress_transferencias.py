@@ -0,0 +1,82 @@
+# Teste de estresse: transferências concorrentes entre muitas contas, em várias
+# threads, verificando que o total de dinheiro se conserva e que nenhuma
+# conta fica com saldo negativo. Em paralelo, uma thread gera extratos das
+# contas enquanto elas são movimentadas.
+#
+# Uso (a partir da raiz do repositório):
+#   python benchmarks/stress_transferencias.py [threads] [contas] [transferencias_por_thread]
+
+import io
+import os
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from datetime import date
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_sincronizada import ContaCorrenteSincronizada
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+
+def main() -> None:
+    quantidade_threads = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    quantidade_contas = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    transferencias_por_thread = int(sys.argv[3]) if len(sys.argv) > 3 else 20_000
+
+    sys.setswitchinterval(1e-6)  # força trocas de thread frequentes
+    Conta.definir_notificador(None)
+    titular = Titular('Estresse', '00000000000', date(year=1991, month=8, day=6))
+    contas = [ContaCorrenteSincronizada(titular, '0001', f'{i:05d}') for i in range(quantidade_contas)]
+    for conta in contas:
+        conta.deposito(1000)
+    total_inicial = sum(conta._saldo for conta in contas)
+
+    def transferir(semente: int) -> int:
+        gerador = random.Random(semente)
+        sucessos = 0
+        for _ in range(transferencias_por_thread):
+            origem, destino = gerador.sample(contas, 2)
+            if origem.transferencia(gerador.randint(1, 300), destino).sucesso:
+                sucessos += 1
+        return sucessos
+
+    fim = Event()
+
+    def ler_extratos() -> int:
+        # Extratos concorrentes com as transferências: não pode haver erro
+        # nem linha pela metade
+        gerador = random.Random(-1)
+        leituras = 0
+        while not fim.is_set():
+            destino = io.StringIO()
+            gerador.choice(contas).extrato(destino)
+            assert destino.getvalue().startswith('Agencia: '), 'Extrato incompleto'
+            leituras += 1
+        return leituras
+
+    inicio = perf_counter()
+    with ThreadPoolExecutor(max_workers=quantidade_threads + 1) as executor:
+        leitor = executor.submit(ler_extratos)
+        sucessos = sum(executor.map(transferir, range(quantidade_threads)))
+        fim.set()
+        extratos = leitor.result()
+    duracao = perf_counter() - inicio
+
+    total_final = sum(conta._saldo for conta in contas)
+    assert total_final == total_inicial, f'Dinheiro não conservado: {total_inicial} != {total_final}'
+    assert all(conta._saldo >= 0 for conta in contas), 'Conta com saldo negativo'
+    for conta in contas:
+        assert conta._extrato.saldo == conta._saldo, f'Extrato divergente na conta {conta.conta}'
+
+    total = quantidade_threads * transferencias_por_thread
+    print(f'{total} transferências ({sucessos} aceitas) em {duracao:.2f} s com {quantidade_threads} threads'
+          f' e {extratos} extratos concorrentes')
+    print('OK: total conservado e nenhum saldo negativo')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+# Suíte de benchmarks dos caminhos críticos, com linha de base gravada e
+# relatório de regressão. Cada caso é medido como no pyperf: aquecimento e
+# várias repetições de um laço cronometrado. A comparação usa o menor tempo
+# por operação entre as repetições (como recomenda o timeit: as repetições
+# mais lentas medem interferência da máquina, não o código); a mediana e a
+# dispersão (desvio absoluto mediano) ficam registradas para referência.
+#
+# Interferência da máquina costuma vir em rajadas que pegam todas as
+# repetições de um caso. Por isso um caso que passe do limiar é medido de
+# novo (até CONFIRMACOES vezes, ficando com o menor tempo) antes de ser
+# declarado regressão.
+#
+# Uso (a partir da raiz do repositório):
+#   python benchmarks/suite_regressao.py executar
+#   python benchmarks/suite_regressao.py salvar [arquivo_linha_de_base]
+#   python benchmarks/suite_regressao.py comparar [arquivo_linha_de_base] [limiar_%]
+#
+# `comparar` termina com código 1 se algum caso ficar mais lento que a linha
+# de base além do limiar (padrão 20%) e do ruído das duas medidas. A linha de
+# base padrão é benchmarks/linha_de_base.json; como os tempos dependem da
+# máquina, grave uma nova ao trocar de ambiente.
+
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+from datetime import date, datetime
+from time import perf_counter
+from typing import Callable, Dict, List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_importacao import tempo_importacao_us
+from modulos_e_pacotes.biblioteca_contas.pacote_contas import ContaCorrente
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_cache_extrato import CacheExtratos
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_relatorio_extrato import escrever
+from modulos_e_pacotes.biblioteca_contas.pacote_drex import Drex
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_registro_cpf import RegistroCpf
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+LINHA_DE_BASE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'linha_de_base.json')
+REPETICOES = 7
+AQUECIMENTO = 1
+LIMIAR_PADRAO = 20.0
+CONFIRMACOES = 3
+
+# Um caso prepara o estado e devolve (laço, operações por chamada do laço)
+Caso = Callable[[], Tuple[Callable[[], object], int]]
+CASOS: Dict[str, Caso] = {}
+
+
+def caso(nome: str) -> Callable[[Caso], Caso]:
+    def registrar(funcao: Caso) -> Caso:
+        CASOS[nome] = funcao
+        return funcao
+    return registrar
+
+
+def _conta(saldo: float = 0.0) -> ContaCorrente:
+    conta = ContaCorrente(Titular('Benchmark', '52998224725', date(year=1991, month=8, day=6)), '0001', '00001')
+    if saldo:
+        conta.deposito(saldo)
+    return conta
+
+
+@caso('conta.deposito')
+def _deposito():
+    deposito = _conta().deposito
+    faixa = range(20_000)
+    return lambda: [deposito(10.0) for _ in faixa], len(faixa)
+
+
+@caso('conta.saque')
+def _saque():
+    saque = _conta(1e9).saque
+    faixa = range(20_000)
+    return lambda: [saque(10.0) for _ in faixa], len(faixa)
+
+
+@caso('conta.transferencia')
+def _transferencia():
+    transferencia = _conta(1e9).transferencia
+    destino = _conta()
+    faixa = range(10_000)
+    return lambda: [transferencia(10.0, destino) for _ in faixa], len(faixa)
+
+
+@caso('conta.aplicar_lote')
+def _aplicar_lote():
+    conta = _conta(1e9)
+    lote = [('deposito', 10.0), ('saque', 10.0)] * 10_000
+    return lambda: conta.aplicar_lote(lote), len(lote)
+
+
+@caso('extrato.texto')
+def _extrato():
+    # Renderização completa, sem o cache de extratos
+    import io
+
+    conta = _conta()
+    conta.aplicar_lote([('deposito', 10.0)] * 20_000)
+    return lambda: escrever(conta, io.StringIO()), 20_000
+
+
+@caso('extrato.cache_incremental')
+def _extrato_cache():
+    # Um movimento novo e o extrato de novo, em uma conta com histórico longo
+    import io
+
+    conta = _conta()
+    conta.aplicar_lote([('deposito', 10.0)] * 20_000)
+    escrever_cache = CacheExtratos().escrever
+    escrever_cache(conta, io.StringIO())
+    deposito = conta.deposito
+    faixa = range(2_000)
+
+    def atualizar():
+        for _ in faixa:
+            deposito(10.0)
+            escrever_cache(conta, io.StringIO())
+    return atualizar, len(faixa)
+
+
+@caso('registro_cpf.adicionar')
+def _registro_adicionar():
+    cpfs = [f'{numero:011d}' for numero in random.Random(1).sample(range(10 ** 11), 200_000)]
+
+    def adicionar():
+        registro = RegistroCpf(digitos_prefixo=2)
+        for cpf in cpfs:
+            registro.adicionar(cpf)
+    return adicionar, len(cpfs)
+
+
+@caso('registro_cpf.contem')
+def _registro_contem():
+    cpfs = [f'{numero:011d}' for numero in random.Random(1).sample(range(10 ** 11), 1_000_000)]
+    registro = RegistroCpf(digitos_prefixo=2)
+    registro.carregar_em_lote(cpfs)
+    consultas = cpfs[::5] + [f'{numero:011d}' for numero in range(200_000)]
+    return lambda: [cpf in registro for cpf in consultas], len(consultas)
+
+
+@caso('drex.soma')
+def _drex_soma():
+    valores = [Drex.de_centavos(centavos) for centavos in random.Random(1).choices(range(100_000), k=50_000)]
+
+    def somar():
+        total = Drex(0)
+        for valor in valores:
+            total = total + valor
+    return somar, len(valores)
+
+
+@caso('drex.multiplicacao')
+def _drex_multiplicacao():
+    valores = [Drex.de_centavos(centavos) for centavos in random.Random(1).choices(range(100_000), k=20_000)]
+    return lambda: [valor * 1.01 for valor in valores], len(valores)
+
+
+@caso('importacao.modulos_e_pacotes')
+def _importacao():
+    # Uma importação em interpretador novo por chamada; o tempo medido é o
+    # de importação (-X importtime), não o de criar o processo.
+    codigo = 'from modulos_e_pacotes.biblioteca_contas.pacote_contas import ContaCorrente'
+    return lambda: tempo_importacao_us(codigo) * 1_000, None
+
+
+def medir(nome: str) -> Dict[str, float]:
+    laco, operacoes = CASOS[nome]()
+    amostras: List[float] = []
+    for repeticao in range(AQUECIMENTO + REPETICOES):
+        inicio = perf_counter()
+        retorno = laco()
+        duracao_ns = (perf_counter() - inicio) * 1e9
+        if operacoes is None:  # o próprio caso informa o tempo em ns
+            duracao_ns, quantidade = retorno, 1
+        else:
+            quantidade = operacoes
+        if repeticao >= AQUECIMENTO:
+            amostras.append(duracao_ns / quantidade)
+    mediana = statistics.median(amostras)
+    desvio = statistics.median(abs(amostra - mediana) for amostra in amostras)
+    return {'ns_por_operacao': min(amostras), 'mediana_ns': mediana, 'desvio_ns': desvio}
+
+
+def executar() -> Dict[str, Dict[str, float]]:
+    resultados = {}
+    for nome in CASOS:
+        resultados[nome] = medida = medir(nome)
+        print(f'{nome:>30}: {medida["ns_por_operacao"]:>12.1f} ns/op  ± {medida["desvio_ns"]:.1f}')
+    return resultados
+
+
+def salvar(caminho: str) -> None:
+    dados = {
+        'gravado_em': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'casos': executar(),
+    }
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(dados, arquivo, indent=2, sort_keys=True)
+        arquivo.write('\n')
+    print(f'Linha de base gravada em {caminho}')
+
+
+def _mais_lento(atual: Dict[str, float], anterior: Dict[str, float], limiar: float) -> bool:
+    # Só é regressão se passar do limiar e a diferença superar o ruído
+    diferenca = atual['ns_por_operacao'] - anterior['ns_por_operacao']
+    return (diferenca > anterior['ns_por_operacao'] * limiar / 100
+            and diferenca > atual['desvio_ns'] + anterior['desvio_ns'])
+
+
+def comparar(caminho: str, limiar: float) -> bool:
+    # Retorna True se não houve regressão
+    with open(caminho, encoding='utf-8') as arquivo:
+        base = json.load(arquivo)
+    print(f'Linha de base: {caminho} ({base["gravado_em"]}, Python {base["python"]})')
+    atuais = executar()
+    print()
+    print(f'{"caso":>30}  {"base ns/op":>12}  {"atual ns/op":>12}  {"variação":>9}')
+    regressoes = []
+    for nome, atual in atuais.items():
+        anterior = base['casos'].get(nome)
+        if anterior is None:
+            print(f'{nome:>30}  {"-":>12}  {atual["ns_por_operacao"]:>12.1f}  {"novo":>9}')
+            continue
+        esperado = anterior['ns_por_operacao']
+        for _ in range(CONFIRMACOES):
+            if not _mais_lento(atual, anterior, limiar):
+                break
+            nova = medir(nome)
+            if nova['ns_por_operacao'] < atual['ns_por_operacao']:
+                atual = nova
+        variacao = (atual['ns_por_operacao'] / esperado - 1) * 100
+        ruido = atual['desvio_ns'] + anterior['desvio_ns']
+        diferenca = atual['ns_por_operacao'] - esperado
+        marca = ''
+        if _mais_lento(atual, anterior, limiar):
+            regressoes.append(nome)
+            marca = '  <-- regressão'
+        elif variacao < -limiar and -diferenca > ruido:
+            marca = '  (melhora)'
+        print(f'{nome:>30}  {esperado:>12.1f}  {atual["ns_por_operacao"]:>12.1f}  '
+              f'{variacao:>+8.1f}%{marca}')
+    if regressoes:
+        print(f'Regressões acima de {limiar}%: {", ".join(regressoes)}')
+    return not regressoes
+
+
+def main() -> None:
+    comando = sys.argv[1] if len(sys.argv) > 1 else 'executar'
+    caminho = sys.argv[2] if len(sys.argv) > 2 else LINHA_DE_BASE
+    if comando == 'executar':
+        executar()
+    elif comando == 'salvar':
+        salvar(caminho)
+    elif comando == 'comparar':
+        limiar = float(sys.argv[3]) if len(sys.argv) > 3 else LIMIAR_PADRAO
+        if not comparar(caminho, limiar):
+            sys.exit(1)
+    else:
+        sys.exit(f'Comando inválido: {comando}. Use executar, salvar ou comparar')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,24 @@
+import sys
+from importlib import import_module
+
+
+def exportacoes_sob_demanda(nome_pacote: str, exportacoes: dict[str, str]) -> tuple:
+    # Gera o __getattr__ e o __dir__ de um pacote cujos nomes públicos só são
+    # importados no primeiro acesso (PEP 562). `exportacoes` mapeia cada nome
+    # para o módulo relativo que o define.
+    # Este módulo não importa `typing` de propósito: ele é carregado em toda
+    # importação dos pacotes e deve ser o mais leve possível.
+    namespace = sys.modules[nome_pacote].__dict__
+
+    def __getattr__(nome: str):
+        modulo = exportacoes.get(nome)
+        if modulo is None:
+            raise AttributeError(f'module {nome_pacote!r} has no attribute {nome!r}')
+        valor = getattr(import_module(modulo, nome_pacote), nome)
+        namespace[nome] = valor
+        return valor
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exportacoes))
+
+    return __getattr__, __dir__
@@ -0,0 +1,12 @@
+from modulos_e_pacotes.biblioteca_contas._importacao_tardia import exportacoes_sob_demanda
+
+# Os nomes públicos só são importados no primeiro acesso, para que
+# `import pacote_contas` não carregue a hierarquia de contas inteira.
+_EXPORTACOES = {
+    'ContaCorrente': '.modulo_corrente',
+    'ContaPoupanca': '.modulo_poupanca',
+}
+
+__all__ = list(_EXPORTACOES)
+
+__getattr__, __dir__ = exportacoes_sob_demanda(__name__, _EXPORTACOES)
@@ -0,0 +1,148 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, List, TextIO, Tuple
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_relatorio_extrato import FORMATOS, _RENDERIZADORES
+
+if TYPE_CHECKING:
+    from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+
+# Linhas já renderizadas são agrupadas em blocos de até este tamanho (em
+# caracteres), para que extratos atualizados a cada movimento não virem uma
+# lista com uma string por linha.
+TAMANHO_BLOCO = 1 << 16
+
+
+class _ExtratoRenderizado:
+    __slots__ = ('dados_cabecalho', 'cabecalho', 'blocos', 'quantidade', 'ultima_transacao', 'tamanho')
+
+    def __init__(self) -> None:
+        self.dados_cabecalho: tuple = ()
+        self.cabecalho: str = ''
+        self.blocos: List[str] = []
+        self.quantidade: int = 0  # movimentos já renderizados (os primeiros do extrato)
+        self.ultima_transacao: int = 0  # transação do último deles, para conferir o extrato
+        self.tamanho: int = 0  # caracteres do cabeçalho e dos blocos
+
+
+def _dados_cabecalho(conta: 'Conta') -> tuple:
+    titular = conta.titular
+    return (conta.agencia, conta.conta, titular.nome_titular, titular.cpf, conta._saldo)
+
+
+class CacheExtratos:
+    # Extratos completos já renderizados, por conta e formato. O extrato é só
+    # de acréscimo, então uma nova renderização só formata os movimentos
+    # adicionados desde a anterior; o cabeçalho (agência, conta, titular, CPF
+    # e saldo) é refeito apenas quando algum desses dados muda. Se os
+    # movimentos já renderizados não conferirem mais com o extrato (ex.:
+    # anexar_arquivo), a conta é renderizada de novo do início.
+    #
+    # O total guardado, somando todas as contas, fica abaixo de `limite`
+    # caracteres e de `maximo_entradas` extratos (um por conta e formato):
+    # acima disso saem os renderizados há mais tempo (LRU). O cache mantém
+    # referência às contas que guarda, então uma conta descartada só é
+    # liberada quando sair do cache (ou com invalidar/limpar).
+    def __init__(self, limite: int = 64 * 1024 * 1024, maximo_entradas: int = 1024) -> None:
+        if limite <= 0 or maximo_entradas <= 0:
+            raise ValueError('O limite e o máximo de entradas do cache devem ser positivos')
+        self._limite: int = limite
+        self._maximo_entradas: int = maximo_entradas
+        self._tamanho: int = 0
+        self._entradas: 'OrderedDict[Tuple[Conta, str], _ExtratoRenderizado]' = OrderedDict()
+        self._trava: Lock = Lock()
+
+    @property
+    def limite(self) -> int:
+        return self._limite
+
+    @property
+    def maximo_entradas(self) -> int:
+        return self._maximo_entradas
+
+    @property
+    def tamanho(self) -> int:
+        return self._tamanho
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def _remover(self, chave: Tuple['Conta', str]) -> None:
+        entrada = self._entradas.pop(chave, None)
+        if entrada is not None:
+            self._tamanho -= entrada.tamanho
+
+    def invalidar(self, conta: 'Conta') -> None:
+        with self._trava:
+            for formato in FORMATOS:
+                self._remover((conta, formato))
+
+    def limpar(self) -> None:
+        with self._trava:
+            self._entradas.clear()
+            self._tamanho = 0
+
+    def _atualizada(self, conta: 'Conta', formato: str, anterior: _ExtratoRenderizado) -> _ExtratoRenderizado:
+        # Nova entrada com o que mudou desde `anterior`; a anterior não é
+        # alterada, pois outra thread pode estar escrevendo a partir dela
+        extrato = conta._extrato
+        total = len(extrato)
+        if anterior.quantidade and (total < anterior.quantidade
+                                    or extrato[anterior.quantidade - 1].transacao != anterior.ultima_transacao):
+            anterior = _ExtratoRenderizado()
+        cabecalho, linha = _RENDERIZADORES[formato]
+        entrada = _ExtratoRenderizado()
+        entrada.dados_cabecalho = _dados_cabecalho(conta)
+        if entrada.dados_cabecalho == anterior.dados_cabecalho:
+            entrada.cabecalho = anterior.cabecalho
+        else:
+            entrada.cabecalho = ''.join(cabecalho(conta))
+        entrada.blocos = anterior.blocos[:]
+        entrada.ultima_transacao = anterior.ultima_transacao
+        if total > anterior.quantidade:
+            blocos = entrada.blocos
+            bloco: List[str] = []
+            tamanho = 0
+            if blocos and len(blocos[-1]) < TAMANHO_BLOCO:
+                bloco.append(blocos.pop())
+                tamanho = len(bloco[0])
+            for movimento in extrato.iterar(anterior.quantidade, total):
+                texto = linha(movimento)
+                if tamanho and tamanho + len(texto) > TAMANHO_BLOCO:
+                    blocos.append(''.join(bloco))
+                    bloco.clear()
+                    tamanho = 0
+                bloco.append(texto)
+                tamanho += len(texto)
+            blocos.append(''.join(bloco))
+            entrada.ultima_transacao = extrato[total - 1].transacao
+        entrada.quantidade = total
+        entrada.tamanho = len(entrada.cabecalho) + sum(map(len, entrada.blocos))
+        return entrada
+
+    def escrever(self, conta: 'Conta', destino: TextIO, formato: str = 'texto') -> int:
+        # Mesmo resultado de modulo_relatorio_extrato.escrever(conta, destino,
+        # formato) para o extrato completo. Retorna a quantidade de movimentos.
+        if formato not in _RENDERIZADORES:
+            raise ValueError(f'Formato de extrato inválido: {formato}. Use um de {FORMATOS}')
+        chave = (conta, formato)
+        with self._trava:
+            anterior = self._entradas.get(chave)
+        entrada = anterior
+        if (anterior is None or len(conta._extrato) != anterior.quantidade
+                or _dados_cabecalho(conta) != anterior.dados_cabecalho):
+            entrada = self._atualizada(conta, formato, anterior or _ExtratoRenderizado())
+        with self._trava:
+            # Se outra thread guardou uma versão nesse meio tempo, fica a dela
+            if self._entradas.get(chave) is anterior and entrada is not anterior:
+                self._remover(chave)
+                self._entradas[chave] = entrada
+                self._tamanho += entrada.tamanho
+            if chave in self._entradas:
+                self._entradas.move_to_end(chave)
+            while self._tamanho > self._limite or len(self._entradas) > self._maximo_entradas:
+                self._remover(next(iter(self._entradas)))
+        destino.write(entrada.cabecalho)
+        for bloco in entrada.blocos:
+            destino.write(bloco)
+        return entrada.quantidade
@@ -0,0 +1,84 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_relatorio_extrato import Data, _intervalo
+
+# Motivos de divergência
+SEM_CONTRAPARTIDA = 'sem_contrapartida'
+TRANSACAO_DUPLICADA = 'transacao_duplicada'
+VALOR_DIVERGENTE = 'valor_divergente'
+CONTRAPARTE_DIVERGENTE = 'contraparte_divergente'
+
+
+class Divergencia(NamedTuple):
+    transacao: int
+    motivo: str
+    conta: str  # identificador da conta onde a perna foi encontrada
+    contraparte: str
+    tipo: str
+    centavos: int
+
+
+class RelatorioConciliacao(NamedTuple):
+    movimentos: int  # todos os movimentos lidos no período
+    transferencias: int  # pares de pernas (saída + entrada) conciliados
+    centavos_transferidos: int  # soma dos valores das transferências conciliadas
+    divergencias: List[Divergencia]
+
+    @property
+    def conciliado(self) -> bool:
+        # Partidas dobradas: toda saída tem a entrada correspondente e vice-versa
+        return not self.divergencias
+
+
+# Perna de transferência aguardando o par: (tipo, conta, contraparte, centavos)
+_Perna = Tuple[str, str, str, int]
+
+
+def conciliar(contas: Iterable[Conta], inicio: Optional[Data] = None, fim: Optional[Data] = None,
+              particoes: int = 1) -> RelatorioConciliacao:
+    # Confere as transferências do período entre todas as `contas`: cada
+    # movimento com contraparte é uma perna e precisa de outra, na conta
+    # indicada, com a mesma transação, o tipo oposto e o mesmo valor.
+    #
+    # Junção por hash na transação: cada perna procura o par em um dict de
+    # pernas pendentes; achando, os dois saem do dict. Cada perna é lida uma
+    # vez e a memória é proporcional às pernas ainda sem par. Com
+    # `particoes` > 1 o período é relido `particoes` vezes, cada passada
+    # tratando só as transações com transacao % particoes igual ao número da
+    # passada, o que divide o pico de memória pelo mesmo fator.
+    if particoes < 1:
+        raise ValueError('A quantidade de partições deve ser pelo menos 1')
+    contas = list(contas)
+    movimentos = transferencias = transferidos = 0
+    divergencias: List[Divergencia] = []
+    for particao in range(particoes):
+        pendentes: Dict[int, _Perna] = {}
+        for conta in contas:
+            identificador = conta.identificador
+            primeiro, ultimo = _intervalo(conta, inicio, fim)
+            if not particao:
+                movimentos += ultimo - primeiro
+            for tipo, centavos, _, transacao, contraparte in conta._extrato.iterar(primeiro, ultimo):
+                if not contraparte or transacao % particoes != particao:
+                    continue
+                par = pendentes.pop(transacao, None)
+                if par is None:
+                    pendentes[transacao] = (tipo, identificador, contraparte, centavos)
+                    continue
+                tipo_par, conta_par, contraparte_par, centavos_par = par
+                if tipo_par == tipo:
+                    motivo = TRANSACAO_DUPLICADA
+                elif centavos_par != centavos:
+                    motivo = VALOR_DIVERGENTE
+                elif contraparte_par != identificador or contraparte != conta_par:
+                    motivo = CONTRAPARTE_DIVERGENTE
+                else:
+                    transferencias += 1
+                    transferidos += centavos
+                    continue
+                divergencias.append(Divergencia(transacao, motivo, conta_par, contraparte_par, tipo_par, centavos_par))
+                divergencias.append(Divergencia(transacao, motivo, identificador, contraparte, tipo, centavos))
+        for transacao, (tipo, identificador, contraparte, centavos) in pendentes.items():
+            divergencias.append(Divergencia(transacao, SEM_CONTRAPARTIDA, identificador, contraparte, tipo, centavos))
+    return RelatorioConciliacao(movimentos, transferencias, transferidos, divergencias)
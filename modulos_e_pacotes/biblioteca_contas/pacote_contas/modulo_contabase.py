@@ -0,0 +1,301 @@
+import sys
+from datetime import date, datetime, timedelta
+from time import time_ns
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple, Union
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_cache_extrato import CacheExtratos
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_extrato import Extrato, novo_id_transacao, para_centavos
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_idempotencia import CacheIdempotencia
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_relatorio_extrato import Data, escrever, para_instante
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_resultado import Notificador, Resultado
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+if TYPE_CHECKING:
+    from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_diario import DiarioContas
+    from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_metricas import MetricasContas
+
+
+def _resumo_lote(saldo_inicial: int, resultados: List[Resultado]) -> Tuple[int, bytes]:
+    # Resposta de aplicar_lote guardada no cache de idempotência: o saldo
+    # antes do lote e um bit de sucesso por movimento (1/8 de byte por
+    # movimento, em vez de um Resultado)
+    sucessos = bytearray((len(resultados) + 7) >> 3)
+    for indice, resultado in enumerate(resultados):
+        if resultado.sucesso:
+            sucessos[indice >> 3] |= 1 << (indice & 7)
+    return saldo_inicial, bytes(sucessos)
+
+
+class Conta:
+    __slots__ = ('_titular', '_agencia', '_conta', '_saldo', '_extrato')
+
+    # Compartilhado por todas as contas. Com None (padrão) nenhuma mensagem é
+    # gerada; para mensagens no console use definir_notificador(NotificadorPrint()).
+    notificador: Optional[Notificador] = None
+
+    # Diário durável das movimentações (modulo_diario). Com None nada é gravado.
+    diario: Optional['DiarioContas'] = None
+
+    # Respostas por chave de idempotência, compartilhadas por todas as contas.
+    # As operações que recebem `chave` só são aplicadas uma vez por chave e
+    # conta dentro da validade do cache; repetições devolvem a resposta
+    # original. O cache fica só em memória: não sobrevive a um recuperar().
+    idempotencia: CacheIdempotencia = CacheIdempotencia()
+
+    # Extratos já renderizados (modulo_cache_extrato), compartilhados por
+    # todas as contas. Com None (padrão), extrato() formata todos os
+    # movimentos a cada chamada.
+    cache_extratos: Optional[CacheExtratos] = None
+
+    # Métricas de contagem e latência (modulo_metricas). Com None os métodos
+    # não são instrumentados.
+    metricas: Optional['MetricasContas'] = None
+
+    # Operações medidas quando há métricas (as que a classe não tiver são ignoradas)
+    operacoes_medidas: Tuple[str, ...] = ('deposito', 'saque', 'pagamento', 'transferencia', 'aplicar_lote',
+                                          'extrato')
+
+    # Operações aceitas em aplicar_lote: nome -> (tipo no extrato, nome no Resultado)
+    operacoes_lote: Dict[str, Tuple[str, str]] = {
+        'deposito': ('E', 'Deposito'),
+        'saque': ('S', 'Saque'),
+    }
+
+    def __init__(self, titular: Titular, agencia: str, conta: str) -> None:
+        self._titular: Titular = titular
+        self._agencia: str = agencia
+        self._conta: str = conta
+        self._saldo: int = 0  # em centavos
+        self._extrato: Extrato = Extrato()
+        if self.diario is not None:
+            self.diario.registrar_abertura(self)
+
+    @property
+    def titular(self) -> Titular:
+        return self._titular
+
+    @property
+    def agencia(self) -> str:
+        return self._agencia
+
+    @property
+    def conta(self) -> str:
+        return self._conta
+
+    @conta.setter
+    def conta(self, nova_conta: str) -> None:
+        self._conta = nova_conta
+
+    @property
+    def saldo(self) -> float:
+        return self._saldo / 100
+
+    @property
+    def identificador(self) -> str:
+        # Como a conta aparece como contraparte no extrato de outra conta
+        return f'{self._agencia}/{self._conta}'
+
+    def _adicionar_extrato(self, tipo: str, centavos: int, transacao: int = 0, contraparte: str = '') -> None:
+        instante = time_ns()
+        transacao = transacao or novo_id_transacao()
+        self._extrato.adicionar(tipo, centavos, instante, transacao, contraparte)
+        if self.diario is not None:
+            self.diario.registrar(self, tipo, centavos, instante, transacao, contraparte)
+
+    def _receber_transferencia(self, centavos: int, transacao: int, origem: 'Conta') -> None:
+        # Perna de entrada de uma transferência: mesma transação da saída
+        self._saldo += centavos
+        self._adicionar_extrato(tipo='E', centavos=centavos, transacao=transacao, contraparte=origem.identificador)
+
+    @classmethod
+    def definir_notificador(cls, notificador: Optional[Notificador]) -> None:
+        cls.notificador = notificador
+
+    @staticmethod
+    def definir_diario(diario: Optional['DiarioContas']) -> None:
+        # Um único diário para toda a hierarquia de contas
+        Conta.diario = diario
+
+    @staticmethod
+    def definir_metricas(metricas: Optional['MetricasContas']) -> None:
+        # Instala (ou, com None, remove) a medição nos métodos das contas, em
+        # vez de testar Conta.metricas a cada operação
+        from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_metricas import instrumentar
+
+        instrumentar(metricas)
+        Conta.metricas = metricas
+
+    @staticmethod
+    def definir_cache_extratos(cache: Optional[CacheExtratos]) -> None:
+        Conta.cache_extratos = cache
+
+    @staticmethod
+    def definir_idempotencia(cache: CacheIdempotencia) -> None:
+        Conta.idempotencia = cache
+
+    def _resposta_anterior(self, chave: str, nome_operacao: str,
+                           assinatura: tuple) -> Optional[Union[Resultado, Tuple[int, bytes]]]:
+        # A resposta já dada para `chave` nesta conta, se houver. Reusar a
+        # chave em outra operação (ou com outro valor) é erro do chamador.
+        anterior = self.idempotencia.obter((self._agencia, self._conta, chave))
+        if anterior is None:
+            return None
+        operacao_anterior, resposta = anterior
+        if operacao_anterior != (nome_operacao, assinatura):
+            raise ValueError(f'Chave de idempotência já usada em outra operação nesta conta: {chave!r}')
+        return resposta
+
+    def _guardar_resposta(self, chave: str, nome_operacao: str, assinatura: tuple,
+                          resposta: Union[Resultado, Tuple[int, bytes]]) -> None:
+        self.idempotencia.guardar((self._agencia, self._conta, chave), ((nome_operacao, assinatura), resposta))
+
+    def _resposta(self, sucesso: bool, nome_operacao: str, chave: Optional[str] = None,
+                  assinatura: tuple = ()) -> Resultado:
+        resultado = Resultado(sucesso, nome_operacao, self._saldo)
+        notificador = self.notificador
+        if notificador is not None:
+            notificador.notificar(resultado)
+        if chave is not None:
+            self._guardar_resposta(chave, nome_operacao, assinatura, resultado)
+        return resultado
+
+    def _saida_permitida(self, centavos: int, saldo: int, nome_operacao: str) -> bool:
+        # Regra única para saques e pagamentos, usada também por aplicar_lote.
+        # Subclasses com restrições próprias (ex.: ContaPoupanca) a sobrescrevem.
+        return 0 < centavos <= saldo
+
+    def _saidas(self, valor: float, nome_operacao: str, chave: Optional[str] = None) -> Resultado:
+        centavos = para_centavos(valor)
+        if chave is not None:
+            anterior = self._resposta_anterior(chave, nome_operacao, (centavos,))
+            if anterior is not None:
+                return anterior
+        if self._saida_permitida(centavos, self._saldo, nome_operacao):
+            self._saldo -= centavos
+            self._adicionar_extrato(tipo='s', centavos=centavos)
+            return self._resposta(sucesso=True, nome_operacao=nome_operacao, chave=chave, assinatura=(centavos,))
+        return self._resposta(sucesso=False, nome_operacao=nome_operacao, chave=chave, assinatura=(centavos,))
+
+    def deposito(self, valor: float, chave: Optional[str] = None) -> Resultado:
+        nome_operacao = 'Deposito'
+        centavos = para_centavos(valor)
+        if chave is not None:
+            anterior = self._resposta_anterior(chave, nome_operacao, (centavos,))
+            if anterior is not None:
+                return anterior
+        if centavos > 0:
+            self._saldo += centavos
+            self._adicionar_extrato(tipo='e', centavos=centavos)
+            return self._resposta(sucesso=True, nome_operacao=nome_operacao, chave=chave, assinatura=(centavos,))
+        return self._resposta(sucesso=False, nome_operacao=nome_operacao, chave=chave, assinatura=(centavos,))
+
+    def saque(self, valor: float, chave: Optional[str] = None) -> Resultado:
+        return self._saidas(valor=valor, nome_operacao='Saque', chave=chave)
+
+    def aplicar_lote(self, movimentos: Iterable[Tuple[str, float]], chave: Optional[str] = None) -> List[Resultado]:
+        # Valida e aplica uma sequência de (operacao, valor) em uma única
+        # passada, gravando todas as movimentações aceitas com um só
+        # Extrato.estender. Movimentos recusados não interrompem o lote; uma
+        # operação desconhecida gera ValueError antes de alterar a conta e de
+        # notificar qualquer resultado: as notificações só saem depois que o
+        # lote inteiro foi gravado.
+        # Com `chave`, o lote inteiro é a unidade idempotente; o cache guarda
+        # só o tamanho e o hash do lote, não os movimentos, e como resposta o
+        # saldo inicial e um bit de sucesso por movimento (_resumo_lote), não
+        # a lista de Resultados. A repetição traz os mesmos movimentos, então
+        # a lista é refeita a partir deles.
+        if chave is not None:
+            # Pares normalizados para tupla: lotes vindos de JSON trazem listas
+            movimentos = tuple(map(tuple, movimentos))
+            assinatura = (len(movimentos), hash(movimentos))
+            anterior = self._resposta_anterior(chave, 'Lote', assinatura)
+            if anterior is not None:
+                return self._resultados_lote(movimentos, anterior)
+        operacoes = self.operacoes_lote
+        saida_permitida = self._saida_permitida
+        saldo = self._saldo
+        tipos: List[str] = []
+        valores: List[int] = []
+        resultados: List[Resultado] = []
+        for operacao, valor in movimentos:
+            if operacao not in operacoes:
+                raise ValueError(f'Operação inválida para {type(self).__name__}: {operacao}')
+            tipo, nome_operacao = operacoes[operacao]
+            centavos = para_centavos(valor)
+            if tipo == 'E':
+                sucesso = centavos > 0
+                if sucesso:
+                    saldo += centavos
+            else:
+                sucesso = saida_permitida(centavos, saldo, nome_operacao)
+                if sucesso:
+                    saldo -= centavos
+            if sucesso:
+                tipos.append(tipo)
+                valores.append(centavos)
+            resultados.append(Resultado(sucesso, nome_operacao, saldo))
+        instante = time_ns()
+        transacoes = [novo_id_transacao() for _ in tipos]
+        self._extrato.estender(tipos, valores, [instante] * len(tipos), transacoes)
+        if self.diario is not None:
+            self.diario.registrar_lote(self, tipos, valores, instante, transacoes)
+        if chave is not None:
+            self._guardar_resposta(chave, 'Lote', assinatura, _resumo_lote(self._saldo, resultados))
+        self._saldo = saldo
+        notificador = self.notificador
+        if notificador is not None:
+            for resultado in resultados:
+                notificador.notificar(resultado)
+        return resultados
+
+    def _resultados_lote(self, movimentos: Sequence[Tuple[str, float]],
+                         resumo: Tuple[int, bytes]) -> List[Resultado]:
+        # Inverso de _resumo_lote para os mesmos movimentos
+        operacoes = self.operacoes_lote
+        saldo, sucessos = resumo
+        resultados: List[Resultado] = []
+        for indice, (operacao, valor) in enumerate(movimentos):
+            tipo, nome_operacao = operacoes[operacao]
+            sucesso = bool(sucessos[indice >> 3] & (1 << (indice & 7)))
+            if sucesso:
+                centavos = para_centavos(valor)
+                saldo += centavos if tipo == 'E' else -centavos
+            resultados.append(Resultado(sucesso, nome_operacao, saldo))
+        return resultados
+
+    def _saldo_em_centavos(self, data: Data) -> int:
+        # Uma date considera o dia inteiro. A diferença entre o saldo da conta
+        # e o do extrato é o saldo anterior ao primeiro movimento registrado
+        # (por exemplo, contas recuperadas de um snapshot).
+        instante = para_instante(data, fim=True)
+        if not isinstance(data, datetime):
+            instante -= 1
+        saldo_inicial = self._saldo - self._extrato.saldo
+        return saldo_inicial + self._extrato.saldo_em(instante)
+
+    def saldo_em(self, data: Data) -> float:
+        return self._saldo_em_centavos(data) / 100
+
+    def saldo_medio(self, inicio: date, fim: date) -> float:
+        # Média dos saldos de fim de dia entre `inicio` e `fim`, inclusive
+        if isinstance(inicio, datetime) or isinstance(fim, datetime):
+            raise TypeError('saldo_medio recebe datas (date), não datetime')
+        dias = (fim - inicio).days + 1
+        if dias <= 0:
+            raise ValueError('A data final deve ser igual ou posterior à inicial')
+        total = sum(self._saldo_em_centavos(inicio + timedelta(days=dia)) for dia in range(dias))
+        return total / dias / 100
+
+    def arquivar_historico(self, caminho: str, manter: int = 1000) -> int:
+        # Move o histórico antigo para um arquivo mapeado em memória
+        # (modulo_extrato_frio), mantendo em RAM só os `manter` mais recentes.
+        return self._extrato.arquivar(caminho, manter)
+
+    def extrato(self, destino: Optional[TextIO] = None) -> None:
+        # Para filtros por data, paginação e outros formatos, veja
+        # modulo_relatorio_extrato
+        destino = sys.stdout if destino is None else destino
+        if self.cache_extratos is None:
+            escrever(self, destino)
+        else:
+            self.cache_extratos.escrever(self, destino)
@@ -0,0 +1,36 @@
+from typing import Optional
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_extrato import novo_id_transacao, para_centavos
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_resultado import Resultado
+
+
+class ContaCorrente(Conta):
+    __slots__ = ()
+
+    operacoes_lote = {
+        **Conta.operacoes_lote,
+        'pagamento': ('S', 'Pagamento'),
+    }
+
+    def pagamento(self, valor: float, chave: Optional[str] = None) -> Resultado:
+        return self._saidas(valor=valor, nome_operacao='Pagamento', chave=chave)
+
+    def transferencia(self, valor: float, conta_destino: Conta, chave: Optional[str] = None) -> Resultado:
+        # A chave de idempotência vale para a conta de origem
+        nome_operacao = 'Transferencia'
+        centavos = para_centavos(valor)
+        assinatura = (centavos, conta_destino.identificador) if chave is not None else ()
+        if chave is not None:
+            anterior = self._resposta_anterior(chave, nome_operacao, assinatura)
+            if anterior is not None:
+                return anterior
+        if 0 < centavos <= self._saldo:
+            # As duas pernas compartilham a transação e apontam uma para a outra
+            transacao = novo_id_transacao()
+            conta_destino._receber_transferencia(centavos, transacao, self)
+            self._saldo -= centavos
+            self._adicionar_extrato(tipo='S', centavos=centavos, transacao=transacao,
+                                    contraparte=conta_destino.identificador)
+            return self._resposta(sucesso=True, nome_operacao=nome_operacao, chave=chave, assinatura=assinatura)
+        return self._resposta(sucesso=False, nome_operacao=nome_operacao, chave=chave, assinatura=assinatura)
@@ -0,0 +1,359 @@
+import json
+import os
+import re
+import struct
+import zlib
+from datetime import date
+from threading import Event, Lock, Thread
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+if TYPE_CHECKING:
+    from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+    from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_repositorio import RepositorioContas
+
+# Formato de cada registro do diário (little-endian):
+#   cabeçalho  <II : tamanho do corpo, crc32 do corpo
+#   corpo      <cqqB: tipo ('A' abertura, 'E' entrada, 'S' saída), centavos,
+#                     instante (ns), quantidade de campos de texto
+#              seguido de cada campo como <H (tamanho) + bytes utf-8.
+# Movimentos têm os campos [agencia, conta, transacao, contraparte] (diários
+# antigos só [agencia, conta]); aberturas têm
+# [agencia, conta, classe, nome, cpf, data_nascimento].
+CABECALHO = struct.Struct('<II')
+CORPO = struct.Struct('<cqqB')
+TAMANHO_CAMPO = struct.Struct('<H')
+
+ABERTURA = b'A'
+
+_PADRAO_ARQUIVO = re.compile(r'^(diario|snapshot)-(\d{8})\.(log|json)$')
+
+
+def _codificar(tipo: bytes, centavos: int, instante: int, campos: Sequence[str]) -> bytes:
+    partes = [CORPO.pack(tipo, centavos, instante, len(campos))]
+    for campo in campos:
+        dados = campo.encode('utf-8')
+        partes.append(TAMANHO_CAMPO.pack(len(dados)))
+        partes.append(dados)
+    corpo = b''.join(partes)
+    return CABECALHO.pack(len(corpo), zlib.crc32(corpo)) + corpo
+
+
+def _decodificar(corpo: bytes) -> Tuple[bytes, int, int, List[str]]:
+    tipo, centavos, instante, quantidade = CORPO.unpack_from(corpo)
+    posicao = CORPO.size
+    campos = []
+    for _ in range(quantidade):
+        (tamanho,) = TAMANHO_CAMPO.unpack_from(corpo, posicao)
+        posicao += TAMANHO_CAMPO.size
+        campos.append(corpo[posicao:posicao + tamanho].decode('utf-8'))
+        posicao += tamanho
+    return tipo, centavos, instante, campos
+
+
+def ler_registros(caminho: str) -> Tuple[List[Tuple[bytes, int, int, List[str]]], int]:
+    # Lê os registros válidos do arquivo e retorna também o tamanho do trecho
+    # válido. Um registro incompleto ou com CRC errado (escrita interrompida
+    # por uma queda) encerra a leitura.
+    registros = []
+    with open(caminho, 'rb') as arquivo:
+        dados = arquivo.read()
+    posicao = 0
+    while posicao + CABECALHO.size <= len(dados):
+        tamanho, crc = CABECALHO.unpack_from(dados, posicao)
+        inicio = posicao + CABECALHO.size
+        corpo = dados[inicio:inicio + tamanho]
+        if len(corpo) < tamanho or zlib.crc32(corpo) != crc:
+            break
+        registros.append(_decodificar(corpo))
+        posicao = inicio + tamanho
+    return registros, posicao
+
+
+class DiarioContas:
+    # Diário (write-ahead log) só de acréscimo para as movimentações das contas.
+    #
+    # Os registros ficam em memória até formarem um grupo de `tamanho_grupo`
+    # e então são gravados com um único write + fsync (group commit). Com
+    # `atraso_maximo` (segundos), uma thread de fundo grava também os grupos
+    # incompletos, então nenhum registro espera mais que isso em memória; sem
+    # ele, chame confirmar() quando precisar de durabilidade imediata.
+    #
+    # snapshot() grava os saldos de todas as contas e inicia um novo arquivo de
+    # diário; recuperar() reconstrói as contas a partir do último snapshot mais
+    # os diários gravados depois dele. Com `registros_por_snapshot`, a thread
+    # de fundo inicia um novo diário a cada tantos registros e grava o
+    # snapshot a partir dos arquivos (snapshot anterior + diário fechado), sem
+    # ler as contas: o resultado é consistente mesmo com as contas em uso, e
+    # a recuperação não precisa reler um diário que só cresce.
+    def __init__(self, diretorio: str, tamanho_grupo: int = 100, sincronizar: bool = True,
+                 atraso_maximo: Optional[float] = None, registros_por_snapshot: Optional[int] = None) -> None:
+        if atraso_maximo is not None and atraso_maximo <= 0:
+            raise ValueError('O atraso máximo deve ser positivo')
+        if registros_por_snapshot is not None and registros_por_snapshot <= 0:
+            raise ValueError('O intervalo entre snapshots deve ser positivo')
+        os.makedirs(diretorio, exist_ok=True)
+        self._diretorio: str = diretorio
+        self._tamanho_grupo: int = tamanho_grupo
+        self._sincronizar: bool = sincronizar
+        self._atraso_maximo: Optional[float] = atraso_maximo
+        self._registros_por_snapshot: Optional[int] = registros_por_snapshot
+        self._pendentes: List[bytes] = []
+        self._trava: Lock = Lock()
+        self._trava_snapshot: Lock = Lock()  # snapshots e recuperação, que trocam e removem arquivos
+        self._sequencia: int = self._ultima_sequencia()
+        self._arquivo: BinaryIO = open(self._caminho('diario', self._sequencia), 'ab')
+        self._registros_no_arquivo: int = 0  # gravados no diário atual por esta instância
+        self._acordar: Event = Event()
+        self._encerrado: bool = False
+        self._trabalhador: Optional[Thread] = None
+        if atraso_maximo is not None or registros_por_snapshot is not None:
+            self._trabalhador = Thread(target=self._trabalhar, name='diario-contas', daemon=True)
+            self._trabalhador.start()
+
+    def _caminho(self, prefixo: str, sequencia: int) -> str:
+        extensao = 'log' if prefixo == 'diario' else 'json'
+        return os.path.join(self._diretorio, f'{prefixo}-{sequencia:08d}.{extensao}')
+
+    def _arquivos(self) -> Iterator[Tuple[str, int]]:
+        for nome in os.listdir(self._diretorio):
+            encontrado = _PADRAO_ARQUIVO.match(nome)
+            if encontrado:
+                yield encontrado.group(1), int(encontrado.group(2))
+
+    def _ultima_sequencia(self) -> int:
+        return max((sequencia for _, sequencia in self._arquivos()), default=0)
+
+    def _ultimo_snapshot(self, ate: int) -> int:
+        # Sequência do snapshot mais recente até `ate`; ele cobre todos os
+        # diários anteriores à sua sequência (0 se não houver snapshot)
+        return max((sequencia for prefixo, sequencia in self._arquivos()
+                    if prefixo == 'snapshot' and sequencia <= ate), default=0)
+
+    @property
+    def sequencia(self) -> int:
+        return self._sequencia
+
+    # Escrita
+
+    def _registrar(self, registro: bytes) -> None:
+        with self._trava:
+            self._pendentes.append(registro)
+            cheio = len(self._pendentes) >= self._tamanho_grupo
+        if cheio:
+            self.confirmar()
+
+    def registrar_abertura(self, conta: 'Conta') -> None:
+        titular = conta.titular
+        campos = (conta.agencia, conta.conta, type(conta).__name__,
+                  titular.nome_titular, titular.cpf, titular.data_nascimento.isoformat())
+        self._registrar(_codificar(ABERTURA, 0, 0, campos))
+
+    def registrar(self, conta: 'Conta', tipo: str, centavos: int, instante: int, transacao: int = 0,
+                  contraparte: str = '') -> None:
+        campos = (conta.agencia, conta.conta, str(transacao), contraparte)
+        self._registrar(_codificar(tipo.upper().encode('ascii'), centavos, instante, campos))
+
+    def registrar_lote(self, conta: 'Conta', tipos: Sequence[str], centavos: Sequence[int], instante: int,
+                       transacoes: Optional[Sequence[int]] = None) -> None:
+        agencia, numero = conta.agencia, conta.conta
+        if transacoes is None:
+            transacoes = [0] * len(tipos)
+        registros = [_codificar(tipo.encode('ascii'), valor, instante, (agencia, numero, str(transacao), ''))
+                     for tipo, valor, transacao in zip(tipos, centavos, transacoes)]
+        with self._trava:
+            self._pendentes.extend(registros)
+            cheio = len(self._pendentes) >= self._tamanho_grupo
+        if cheio:
+            self.confirmar()
+
+    def _gravar_pendentes(self) -> int:
+        # Chamado com self._trava
+        pendentes, self._pendentes = self._pendentes, []
+        if not pendentes:
+            return 0
+        self._arquivo.write(b''.join(pendentes))
+        self._arquivo.flush()
+        if self._sincronizar:
+            os.fsync(self._arquivo.fileno())
+        self._registros_no_arquivo += len(pendentes)
+        return len(pendentes)
+
+    def confirmar(self) -> int:
+        # Grava os registros pendentes com um único write e fsync.
+        # Retorna quantos registros foram confirmados.
+        with self._trava:
+            quantidade = self._gravar_pendentes()
+            girar = (self._registros_por_snapshot is not None
+                     and self._registros_no_arquivo >= self._registros_por_snapshot)
+        if girar:
+            self._acordar.set()
+        return quantidade
+
+    def _novo_diario(self) -> int:
+        # Grava o que estiver pendente, fecha o diário atual e abre o próximo.
+        # Retorna a sequência do novo diário.
+        with self._trava:
+            self._gravar_pendentes()
+            self._arquivo.close()
+            self._sequencia += 1
+            self._arquivo = open(self._caminho('diario', self._sequencia), 'ab')
+            self._registros_no_arquivo = 0
+            return self._sequencia
+
+    def _gravar_snapshot(self, sequencia: int, dados: List[dict]) -> None:
+        # Grava o snapshot e remove os arquivos que ele torna desnecessários
+        caminho = self._caminho('snapshot', sequencia)
+        temporario = caminho + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump(dados, arquivo)
+            arquivo.flush()
+            os.fsync(arquivo.fileno())
+        os.replace(temporario, caminho)
+        for prefixo, anterior in list(self._arquivos()):
+            if anterior < sequencia:
+                os.remove(self._caminho(prefixo, anterior))
+
+    def _ler_snapshot(self, sequencia: int) -> List[dict]:
+        caminho = self._caminho('snapshot', sequencia)
+        if not os.path.exists(caminho):
+            return []
+        with open(caminho, encoding='utf-8') as arquivo:
+            return json.load(arquivo)
+
+    def snapshot(self, contas: Iterable['Conta']) -> int:
+        # As contas não devem ser alteradas durante o snapshot.
+        dados = [
+            {
+                'classe': type(conta).__name__,
+                'agencia': conta.agencia,
+                'conta': conta.conta,
+                'nome': conta.titular.nome_titular,
+                'cpf': conta.titular.cpf,
+                'data_nascimento': conta.titular.data_nascimento.isoformat(),
+                'saldo_centavos': conta._saldo,
+            }
+            for conta in contas
+        ]
+        with self._trava_snapshot:
+            self._gravar_snapshot(self._novo_diario(), dados)
+        return len(dados)
+
+    def snapshot_do_diario(self) -> int:
+        # Snapshot montado a partir dos arquivos: inicia um novo diário e
+        # aplica os diários já fechados ao snapshot anterior. Não lê as
+        # contas, então pode rodar com elas em uso. Retorna quantas contas
+        # o snapshot tem.
+        with self._trava_snapshot:
+            sequencia = self._novo_diario()
+            base = self._ultimo_snapshot(sequencia - 1)
+            contas: Dict[Tuple[str, str], dict] = {
+                (item['agencia'], item['conta']): item for item in self._ler_snapshot(base)
+            }
+            for anterior in range(base, sequencia):
+                caminho = self._caminho('diario', anterior)
+                if not os.path.exists(caminho):
+                    continue
+                for tipo, centavos, _, campos in ler_registros(caminho)[0]:
+                    if tipo == ABERTURA:
+                        agencia, numero, classe, nome, cpf, dt_nasc = campos
+                        contas[(agencia, numero)] = {
+                            'classe': classe, 'agencia': agencia, 'conta': numero, 'nome': nome,
+                            'cpf': cpf, 'data_nascimento': dt_nasc, 'saldo_centavos': 0,
+                        }
+                        continue
+                    item = contas.get((campos[0], campos[1]))
+                    if item is None:
+                        raise ValueError(f'Diário corrompido: movimento da conta inexistente {campos[0]}/{campos[1]}')
+                    item['saldo_centavos'] += centavos if tipo == b'E' else -centavos
+            self._gravar_snapshot(sequencia, list(contas.values()))
+        return len(contas)
+
+    def _trabalhar(self) -> None:
+        # Thread de fundo: grava grupos incompletos a cada `atraso_maximo`
+        # segundos e faz o snapshot quando o diário atual passa de
+        # `registros_por_snapshot` registros (confirmar() a acorda)
+        while True:
+            self._acordar.wait(self._atraso_maximo)
+            self._acordar.clear()
+            if self._encerrado:
+                return
+            self.confirmar()
+            with self._trava:
+                girar = (self._registros_por_snapshot is not None
+                         and self._registros_no_arquivo >= self._registros_por_snapshot)
+            if girar:
+                self.snapshot_do_diario()
+
+    def fechar(self) -> None:
+        if self._trabalhador is not None:
+            self._encerrado = True
+            self._acordar.set()
+            self._trabalhador.join()
+        self.confirmar()
+        self._arquivo.close()
+
+    # Recuperação
+
+    def recuperar(self, classes: Optional[Dict[str, Type['Conta']]] = None) -> 'RepositorioContas':
+        from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+        from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_repositorio import RepositorioContas
+
+        if classes is None:
+            classes = _classes_conhecidas()
+        repositorio = RepositorioContas()
+        # As contas reconstruídas não devem ser registradas de novo no diário
+        diario_anterior = Conta.diario
+        Conta.diario = None
+        try:
+            def abrir(classe: str, agencia: str, numero: str, nome: str, cpf: str, dt_nasc: str) -> 'Conta':
+                titular = Titular(nome, cpf, date.fromisoformat(dt_nasc))
+                conta = classes[classe](titular, agencia, numero)
+                repositorio.adicionar(conta)
+                return conta
+
+            with self._trava_snapshot:
+                self.confirmar()
+                base = self._ultimo_snapshot(self._sequencia)
+                for item in self._ler_snapshot(base):
+                    conta = abrir(item['classe'], item['agencia'], item['conta'],
+                                  item['nome'], item['cpf'], item['data_nascimento'])
+                    conta._saldo = item['saldo_centavos']
+
+                # Normalmente só o diário atual; os anteriores existem se uma
+                # queda aconteceu entre iniciar um diário e gravar o snapshot
+                for sequencia in range(base, self._sequencia + 1):
+                    caminho_diario = self._caminho('diario', sequencia)
+                    if not os.path.exists(caminho_diario):
+                        continue
+                    registros, tamanho_valido = ler_registros(caminho_diario)
+                    if sequencia == self._sequencia and tamanho_valido < os.path.getsize(caminho_diario):
+                        os.truncate(caminho_diario, tamanho_valido)
+                    for tipo, centavos, instante, campos in registros:
+                        if tipo == ABERTURA:
+                            agencia, numero, classe, nome, cpf, dt_nasc = campos
+                            abrir(classe, agencia, numero, nome, cpf, dt_nasc)
+                            continue
+                        conta = repositorio.buscar(campos[0], campos[1])
+                        if conta is None:
+                            raise ValueError('Diário corrompido: movimento da conta inexistente '
+                                             f'{campos[0]}/{campos[1]}')
+                        conta._saldo += centavos if tipo == b'E' else -centavos
+                        transacao, contraparte = (int(campos[2]), campos[3]) if len(campos) >= 4 else (0, '')
+                        conta._extrato.adicionar(tipo.decode('ascii'), centavos, instante, transacao, contraparte)
+        finally:
+            Conta.diario = diario_anterior
+        return repositorio
+
+
+def _classes_conhecidas() -> Dict[str, Type['Conta']]:
+    from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+
+    classes: Dict[str, Type[Conta]] = {}
+    pendentes = [Conta]
+    while pendentes:
+        classe = pendentes.pop()
+        classes[classe.__name__] = classe
+        pendentes.extend(classe.__subclasses__())
+    return classes
@@ -0,0 +1,353 @@
+import os
+from array import array
+from bisect import bisect_left
+from itertools import accumulate, count, repeat
+from time import time_ns
+from typing import TYPE_CHECKING, Iterable, Iterator, List, NamedTuple, Optional, Union
+
+if TYPE_CHECKING:
+    from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_extrato_frio import ArquivoExtrato
+
+ENTRADA = ord('E')
+SAIDA = ord('S')
+
+# No histórico frio, guarda-se o saldo acumulado a cada PASSO_PONTOS movimentos
+PASSO_PONTOS = 1024
+
+# Coluna ainda não criada. Uma tupla vazia responde a len, índices, fatias e
+# bisect como uma coluna vazia, mas não aceita append: uma escrita esquecida
+# falha em vez de alterar um objeto compartilhado por todos os extratos.
+_VAZIO: tuple = ()
+
+# Identificadores de transação (int64 positivo): um contador por processo
+# que começa em um ponto aleatório de 62 bits (sorteado de novo após um
+# fork). Não dependem do relógio nem do pid, então nem um processo que gere
+# mais de um identificador por milissegundo nem uma nova execução com o mesmo
+# pid repetem identificadores já gravados (por exemplo, os restaurados por
+# DiarioContas.recuperar). Dois processos só colidem se os intervalos que
+# usarem se sobrepuserem: com k processos gerando n identificadores cada, a
+# probabilidade é de cerca de k² * n / 2**62. O sorteio usa os.urandom, e
+# não secrets, que importaria hashlib, hmac e random junto com Conta.
+
+
+def _novo_contador() -> Iterator[int]:
+    return count((int.from_bytes(os.urandom(8), 'little') >> 2) + 1)
+
+
+_contador_transacoes = _novo_contador()
+
+
+def _reiniciar_contador() -> None:
+    global _contador_transacoes
+    _contador_transacoes = _novo_contador()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reiniciar_contador)
+
+
+def novo_id_transacao() -> int:
+    return next(_contador_transacoes)
+
+
+def para_centavos(valor: float) -> int:
+    return int(round(valor * 100))
+
+
+def formatar_centavos(centavos: int) -> str:
+    sinal = '-' if centavos < 0 else ''
+    reais, resto = divmod(abs(centavos), 100)
+    return f'{sinal}{reais}.{resto:02d}'
+
+
+class Movimento(NamedTuple):
+    tipo: str
+    centavos: int
+    instante: int
+    transacao: int = 0  # as duas pernas de uma transferência têm o mesmo
+    contraparte: str = ''  # 'agencia/conta' da outra perna; '' se não houver
+
+    @property
+    def valor_formatado(self) -> str:
+        return formatar_centavos(self.centavos)
+
+
+class Extrato:
+    # Movimentações guardadas em colunas tipadas, em vez de uma lista de dicts:
+    # tipo como byte ('E'/'S'), valor em centavos (int64), instante em
+    # nanossegundos desde a época (int64) e identificador da transação
+    # (int64). A contraparte fica em uma lista de str, quase sempre a mesma
+    # string vazia. A formatação só acontece na exibição.
+    #
+    # O histórico antigo pode ser movido para um arquivo mapeado em memória
+    # (arquivar); índices, buscas e iteração continuam cobrindo o histórico
+    # inteiro, com a parte fria primeiro e a cauda quente em memória depois.
+    #
+    # Para consultas de saldo histórico em O(log n), cada movimento em memória
+    # guarda também o saldo acumulado após ele (soma de prefixos), e o
+    # histórico frio guarda pontos de controle a cada PASSO_PONTOS movimentos.
+    #
+    # Contas sem movimentos são a maioria, então nenhuma coluna existe até
+    # ser usada: as colunas principais nascem no primeiro movimento, as
+    # contrapartes na primeira contraparte não vazia, os saldos acumulados na
+    # primeira consulta de saldo histórico e os pontos de controle no
+    # primeiro arquivamento. Até lá cada uma é _VAZIO.
+    __slots__ = ('_tipos', '_centavos', '_instantes', '_transacoes', '_contrapartes', '_acumulados',
+                 '_total_entradas', '_total_saidas', '_frio', '_pontos_frio')
+
+    def __init__(self) -> None:
+        self._tipos: Union[array, tuple] = _VAZIO
+        self._centavos: Union[array, tuple] = _VAZIO
+        self._instantes: Union[array, tuple] = _VAZIO
+        self._transacoes: Union[array, tuple] = _VAZIO
+        self._contrapartes: Union[List[str], tuple] = _VAZIO  # _VAZIO: todas ''
+        self._acumulados: Union[array, tuple] = _VAZIO
+        self._total_entradas: int = 0
+        self._total_saidas: int = 0
+        self._frio: Optional['ArquivoExtrato'] = None
+        self._pontos_frio: Union[array, tuple] = _VAZIO
+
+    def _criar_colunas(self) -> None:
+        self._tipos = array('b')
+        self._centavos = array('q')
+        self._instantes = array('q')
+        self._transacoes = array('q')
+
+    def _lista_contrapartes(self) -> List[str]:
+        # Chamada antes de crescer as colunas principais
+        if self._contrapartes is _VAZIO:
+            self._contrapartes = [''] * len(self._tipos)
+        return self._contrapartes
+
+    def _saldos_acumulados(self) -> array:
+        # Soma de prefixos da parte em memória, calculada na primeira consulta
+        # e mantida a cada movimento a partir daí
+        if self._acumulados is _VAZIO:
+            variacoes = [valor if codigo == ENTRADA else -valor
+                         for codigo, valor in zip(self._tipos, self._centavos)]
+            self._acumulados = array('q', accumulate(variacoes, initial=self.saldo - sum(variacoes)))
+            del self._acumulados[0]
+        return self._acumulados
+
+    @staticmethod
+    def _codigo_tipo(tipo: str) -> int:
+        codigo = ord(tipo.upper())
+        if codigo != ENTRADA and codigo != SAIDA:
+            raise ValueError(f'Tipo de movimentação inválido: {tipo}')
+        return codigo
+
+    def adicionar(self, tipo: str, centavos: int, instante: Optional[int] = None, transacao: int = 0,
+                  contraparte: str = '') -> None:
+        # Sem `transacao`, o movimento recebe um identificador novo
+        codigo = self._codigo_tipo(tipo)
+        if self._tipos is _VAZIO:
+            self._criar_colunas()
+        if contraparte or self._contrapartes is not _VAZIO:
+            self._lista_contrapartes().append(contraparte)
+        self._tipos.append(codigo)
+        self._centavos.append(centavos)
+        self._instantes.append(time_ns() if instante is None else instante)
+        self._transacoes.append(transacao or novo_id_transacao())
+        if codigo == ENTRADA:
+            self._total_entradas += centavos
+        else:
+            self._total_saidas += centavos
+        if self._acumulados is not _VAZIO:
+            self._acumulados.append(self._total_entradas - self._total_saidas)
+
+    def estender(self, tipos: Iterable[str], centavos: Iterable[int], instantes: Iterable[int],
+                 transacoes: Optional[Iterable[int]] = None, contrapartes: Optional[Iterable[str]] = None) -> None:
+        # Sem `transacoes`, cada movimento recebe um identificador novo
+        codigos = array('b', [self._codigo_tipo(tipo) for tipo in tipos])
+        valores = array('q', centavos)
+        marcas = array('q', instantes)
+        if transacoes is None:
+            identificadores = array('q', [novo_id_transacao() for _ in range(len(codigos))])
+        else:
+            identificadores = array('q', transacoes)
+        outras = [''] * len(codigos) if contrapartes is None else list(contrapartes)
+        if not len(codigos) == len(valores) == len(marcas) == len(identificadores) == len(outras):
+            raise ValueError('As colunas do lote devem ter o mesmo tamanho')
+        if not len(codigos):
+            return
+        if self._tipos is _VAZIO:
+            self._criar_colunas()
+        if self._contrapartes is not _VAZIO or any(outras):
+            self._lista_contrapartes().extend(outras)
+        self._tipos.extend(codigos)
+        self._centavos.extend(valores)
+        self._instantes.extend(marcas)
+        self._transacoes.extend(identificadores)
+        acumulados = self._acumulados
+        for codigo, valor in zip(codigos, valores):
+            if codigo == ENTRADA:
+                self._total_entradas += valor
+            else:
+                self._total_saidas += valor
+            if acumulados is not _VAZIO:
+                acumulados.append(self._total_entradas - self._total_saidas)
+
+    @property
+    def total_entradas(self) -> int:
+        return self._total_entradas
+
+    @property
+    def total_saidas(self) -> int:
+        return self._total_saidas
+
+    @property
+    def saldo(self) -> int:
+        return self._total_entradas - self._total_saidas
+
+    @property
+    def quantidade_fria(self) -> int:
+        return 0 if self._frio is None else len(self._frio)
+
+    def arquivar(self, caminho: str, manter: int = 0) -> int:
+        # Move para o arquivo frio todos os movimentos em memória, exceto os
+        # `manter` mais recentes. Retorna quantos movimentos foram arquivados.
+        from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_extrato_frio import ArquivoExtrato, gravar_registros
+
+        if self._frio is not None and self._frio.caminho != caminho:
+            raise ValueError(f'Extrato já arquivado em outro arquivo: {self._frio.caminho}')
+        quantidade = max(len(self._tipos) - manter, 0)
+        if not quantidade:
+            return 0
+        quantidade_fria = self.quantidade_fria
+        primeiro_ponto = quantidade_fria + PASSO_PONTOS - quantidade_fria % PASSO_PONTOS
+        acumulados = self._saldos_acumulados()
+        pontos = [acumulados[total - quantidade_fria - 1]
+                  for total in range(primeiro_ponto, quantidade_fria + quantidade + 1, PASSO_PONTOS)]
+        contrapartes = repeat('') if self._contrapartes is _VAZIO else self._contrapartes[:quantidade]
+        # Se a gravação falhar (ex.: contraparte que não cabe no registro), o
+        # extrato fica como estava
+        gravar_registros(caminho, zip(
+            map(chr, self._tipos[:quantidade]), self._centavos[:quantidade], self._instantes[:quantidade],
+            self._transacoes[:quantidade], contrapartes,
+        ))
+        if self._pontos_frio is _VAZIO:
+            self._pontos_frio = array('q')
+        self._pontos_frio.extend(pontos)
+        del self._tipos[:quantidade]
+        del self._centavos[:quantidade]
+        del self._instantes[:quantidade]
+        del self._transacoes[:quantidade]
+        if self._contrapartes is not _VAZIO:
+            del self._contrapartes[:quantidade]
+        del self._acumulados[:quantidade]
+        if self._frio is not None:
+            self._frio.fechar()
+        self._frio = ArquivoExtrato(caminho)
+        return quantidade
+
+    def anexar_arquivo(self, arquivo: 'ArquivoExtrato') -> None:
+        # Associa um histórico frio já gravado (por exemplo, ao reabrir a conta).
+        # Os totais passam a incluir os movimentos do arquivo.
+        if self._frio is not None:
+            raise ValueError('Extrato já possui um arquivo frio')
+        self._frio = arquivo
+        if self._pontos_frio is _VAZIO:
+            self._pontos_frio = array('q')
+        entradas = saidas = 0
+        for quantidade, movimento in enumerate(arquivo, start=1):
+            if movimento.tipo == 'E':
+                entradas += movimento.centavos
+            else:
+                saidas += movimento.centavos
+            if quantidade % PASSO_PONTOS == 0:
+                self._pontos_frio.append(entradas - saidas)
+        self._total_entradas += entradas
+        self._total_saidas += saidas
+        saldo_frio = entradas - saidas
+        if self._acumulados is not _VAZIO:
+            self._acumulados = array('q', (acumulado + saldo_frio for acumulado in self._acumulados))
+
+    def posicao(self, instante: int) -> int:
+        # Índice do primeiro movimento com instante >= `instante`. Os
+        # movimentos são gravados em ordem cronológica, então a busca é binária.
+        frio = self._frio
+        if frio is not None and len(frio):
+            if instante <= frio.instante(len(frio) - 1):
+                return frio.posicao(instante)
+            return len(frio) + bisect_left(self._instantes, instante)
+        return bisect_left(self._instantes, instante)
+
+    def saldo_ate(self, posicao: int) -> int:
+        # Saldo acumulado dos `posicao` primeiros movimentos
+        if posicao <= 0:
+            return 0
+        quantidade_fria = self.quantidade_fria
+        if posicao > quantidade_fria:
+            return self._saldos_acumulados()[min(posicao, len(self)) - quantidade_fria - 1]
+        ponto = posicao // PASSO_PONTOS
+        saldo = self._pontos_frio[ponto - 1] if ponto else 0
+        for movimento in self._frio.iterar(ponto * PASSO_PONTOS, posicao):
+            saldo += movimento.centavos if movimento.tipo == 'E' else -movimento.centavos
+        return saldo
+
+    def saldo_em(self, instante: int) -> int:
+        # Saldo acumulado com todos os movimentos até `instante` (inclusive)
+        return self.saldo_ate(self.posicao(instante + 1))
+
+    def iterar(self, inicio: int = 0, fim: Optional[int] = None) -> Iterator[Movimento]:
+        # Percorre os movimentos [inicio, fim) sem montar uma lista
+        quantidade_fria = self.quantidade_fria
+        fim = len(self) if fim is None else min(fim, len(self))
+        if inicio < quantidade_fria:
+            yield from self._frio.iterar(inicio, min(fim, quantidade_fria))
+        inicio_quente = max(inicio - quantidade_fria, 0)
+        fim_quente = fim - quantidade_fria
+        for indice in range(inicio_quente, fim_quente):
+            yield self._movimento(indice)
+
+    def _movimento(self, indice: int) -> Movimento:
+        # Movimento na posição `indice` da parte em memória
+        contrapartes = self._contrapartes
+        return Movimento(chr(self._tipos[indice]), self._centavos[indice], self._instantes[indice],
+                         self._transacoes[indice], '' if contrapartes is _VAZIO else contrapartes[indice])
+
+    def __len__(self) -> int:
+        return self.quantidade_fria + len(self._tipos)
+
+    def __getitem__(self, indice: Union[int, slice]) -> Union[Movimento, 'Extrato']:
+        quantidade_fria = self.quantidade_fria
+        if isinstance(indice, slice) and quantidade_fria:
+            fatia = Extrato()
+            for posicao in range(*indice.indices(len(self))):
+                movimento = self[posicao]
+                fatia.adicionar(*movimento)
+            return fatia
+        if isinstance(indice, slice):
+            fatia = Extrato()
+            if self._tipos is _VAZIO:
+                return fatia
+            fatia._tipos = self._tipos[indice]
+            fatia._centavos = self._centavos[indice]
+            fatia._instantes = self._instantes[indice]
+            fatia._transacoes = self._transacoes[indice]
+            if self._contrapartes is not _VAZIO:
+                fatia._contrapartes = self._contrapartes[indice]
+            for codigo, valor in zip(fatia._tipos, fatia._centavos):
+                if codigo == ENTRADA:
+                    fatia._total_entradas += valor
+                else:
+                    fatia._total_saidas += valor
+            return fatia
+        if quantidade_fria:
+            if indice < 0:
+                indice += len(self)
+            if indice < quantidade_fria:
+                return self._frio[indice]
+            indice -= quantidade_fria
+        return self._movimento(indice)
+
+    def __iter__(self) -> Iterator[Movimento]:
+        if self._frio is not None:
+            yield from self._frio
+        contrapartes = repeat('') if self._contrapartes is _VAZIO else self._contrapartes
+        for codigo, valor, instante, transacao, contraparte in zip(
+                self._tipos, self._centavos, self._instantes, self._transacoes, contrapartes):
+            yield Movimento(chr(codigo), valor, instante, transacao, contraparte)
+
+    def __repr__(self) -> str:
+        return f'Extrato(movimentos={len(self)}, saldo={formatar_centavos(self.saldo)})'
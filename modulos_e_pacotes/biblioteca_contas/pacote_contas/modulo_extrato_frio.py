@@ -0,0 +1,144 @@
+import mmap
+import os
+import struct
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_extrato import Movimento
+
+# Arquivo de histórico "frio" do extrato: um cabeçalho seguido de registros de
+# tamanho fixo, o que permite acessar o i-ésimo movimento direto pelo
+# deslocamento, sem ler o arquivo inteiro.
+#
+#   cabeçalho <8sII : assinatura, versão, tamanho do registro
+#   registro  <c7xqqq24s (56 bytes): tipo, centavos, instante (ns),
+#             transação, contraparte (utf-8, completada com bytes nulos)
+# Uma contraparte com mais de TAMANHO_CONTRAPARTE bytes não cabe no registro
+# e impede a gravação (ValueError) em vez de ser truncada: truncada, ela não
+# conferiria mais na conciliação e poderia cortar um caractere ao meio.
+# Arquivos da versão 1 (registro <c7xqq24s, sem transação) continuam legíveis;
+# a transação dos seus movimentos é lida como 0.
+ASSINATURA = b'EXTRATO\x00'
+VERSAO = 2
+CABECALHO = struct.Struct('<8sII')
+TAMANHO_CONTRAPARTE = 24
+REGISTRO = struct.Struct(f'<c7xqqq{TAMANHO_CONTRAPARTE}s')
+_REGISTROS: Dict[int, struct.Struct] = {
+    1: struct.Struct(f'<c7xqq{TAMANHO_CONTRAPARTE}s'),
+    VERSAO: REGISTRO,
+}
+
+
+def gravar_registros(caminho: str, registros: Iterable[Tuple[str, int, int, int, str]]) -> int:
+    # Acrescenta (tipo, centavos, instante, transacao, contraparte) ao arquivo,
+    # criando o cabeçalho se ele ainda não existir. Retorna quantos registros
+    # foram gravados. Se algum registro for inválido, nada é gravado.
+    novo = not os.path.exists(caminho) or os.path.getsize(caminho) == 0
+    dados = bytearray()
+    if novo:
+        dados += CABECALHO.pack(ASSINATURA, VERSAO, REGISTRO.size)
+    else:
+        with open(caminho, 'rb') as arquivo:
+            _, versao, _ = CABECALHO.unpack(arquivo.read(CABECALHO.size))
+        if versao != VERSAO:
+            raise ValueError(f'Não é possível acrescentar ao arquivo de extrato versão {versao}: {caminho}')
+    quantidade = 0
+    for tipo, centavos, instante, transacao, contraparte in registros:
+        codificada = contraparte.encode('utf-8')
+        if len(codificada) > TAMANHO_CONTRAPARTE:
+            raise ValueError(f'Contraparte com mais de {TAMANHO_CONTRAPARTE} bytes não cabe no '
+                             f'arquivo de extrato: {contraparte!r}')
+        dados += REGISTRO.pack(tipo.encode('ascii'), centavos, instante, transacao, codificada)
+        quantidade += 1
+    with open(caminho, 'ab') as arquivo:
+        arquivo.write(dados)
+        arquivo.flush()
+        os.fsync(arquivo.fileno())
+    return quantidade
+
+
+class ArquivoExtrato:
+    # Leitura do histórico frio via mmap: as páginas do arquivo só são
+    # carregadas pelo sistema operacional quando acessadas, e cada registro é
+    # decodificado direto do mapa, sem cópias intermediárias.
+    __slots__ = ('_caminho', '_arquivo', '_mapa', '_registro', '_quantidade')
+
+    def __init__(self, caminho: str) -> None:
+        self._caminho: str = caminho
+        self._arquivo = open(caminho, 'rb')
+        self._mapa: mmap.mmap = mmap.mmap(self._arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        assinatura, versao, tamanho_registro = CABECALHO.unpack_from(self._mapa, 0)
+        registro = _REGISTROS.get(versao)
+        if assinatura != ASSINATURA or registro is None or tamanho_registro != registro.size:
+            self.fechar()
+            raise ValueError(f'Arquivo de extrato inválido: {caminho}')
+        self._registro: struct.Struct = registro
+        self._quantidade: int = (len(self._mapa) - CABECALHO.size) // registro.size
+
+    @property
+    def caminho(self) -> str:
+        return self._caminho
+
+    def _deslocamento(self, indice: int) -> int:
+        return CABECALHO.size + indice * self._registro.size
+
+    def _ler(self, indice: int) -> Tuple:
+        return self._registro.unpack_from(self._mapa, self._deslocamento(indice))
+
+    @staticmethod
+    def _movimento(campos: Tuple) -> Movimento:
+        if len(campos) == 4:  # versão 1
+            tipo, centavos, instante, contraparte = campos
+            transacao = 0
+        else:
+            tipo, centavos, instante, transacao, contraparte = campos
+        return Movimento(tipo.decode('ascii'), centavos, instante, transacao,
+                         contraparte.rstrip(b'\x00').decode('utf-8'))
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    def __getitem__(self, indice: int) -> Movimento:
+        if indice < 0:
+            indice += self._quantidade
+        if not 0 <= indice < self._quantidade:
+            raise IndexError('Índice fora do arquivo de extrato')
+        return self._movimento(self._ler(indice))
+
+    def contraparte(self, indice: int) -> str:
+        return self._ler(indice)[-1].rstrip(b'\x00').decode('utf-8')
+
+    def instante(self, indice: int) -> int:
+        return self._ler(indice)[2]
+
+    def posicao(self, instante: int) -> int:
+        # Busca binária pelo primeiro registro com instante >= `instante`
+        inicio, fim = 0, self._quantidade
+        while inicio < fim:
+            meio = (inicio + fim) // 2
+            if self._ler(meio)[2] < instante:
+                inicio = meio + 1
+            else:
+                fim = meio
+        return inicio
+
+    def iterar(self, inicio: int = 0, fim: Optional[int] = None) -> Iterator[Movimento]:
+        fim = self._quantidade if fim is None else min(fim, self._quantidade)
+        if inicio >= fim:
+            return
+        janela = memoryview(self._mapa)[self._deslocamento(inicio):self._deslocamento(fim)]
+        try:
+            movimento = self._movimento
+            for campos in self._registro.iter_unpack(janela):
+                yield movimento(campos)
+        finally:
+            janela.release()
+
+    def __iter__(self) -> Iterator[Movimento]:
+        return self.iterar()
+
+    def fechar(self) -> None:
+        self._mapa.close()
+        self._arquivo.close()
+
+    def __repr__(self) -> str:
+        return f'ArquivoExtrato({self._caminho!r}, movimentos={self._quantidade})'
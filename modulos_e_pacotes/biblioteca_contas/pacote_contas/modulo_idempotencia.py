@@ -0,0 +1,62 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Hashable, Optional
+
+
+class CacheIdempotencia:
+    # Respostas já dadas por chave de idempotência, para que a repetição de
+    # uma requisição (ex.: reenvio após timeout) devolva a resposta original
+    # em vez de aplicar a operação de novo.
+    #
+    # LRU com validade: cada resposta vale por `validade` segundos a partir
+    # de quando foi guardada e, acima de `capacidade` entradas, as menos
+    # usadas são descartadas. A memória fica limitada a `capacidade` entradas
+    # qualquer que seja o tráfego; obter e guardar são O(1) (amortizado).
+    def __init__(self, capacidade: int = 100_000, validade: float = 24 * 3600.0) -> None:
+        if capacidade <= 0 or validade <= 0:
+            raise ValueError('Capacidade e validade devem ser positivas')
+        self._capacidade: int = capacidade
+        self._validade: float = validade
+        self._entradas: 'OrderedDict[Hashable, tuple]' = OrderedDict()  # chave -> (expira_em, valor)
+        self._trava: Lock = Lock()
+
+    @property
+    def capacidade(self) -> int:
+        return self._capacidade
+
+    @property
+    def validade(self) -> float:
+        return self._validade
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+    def obter(self, chave: Hashable) -> Optional[object]:
+        with self._trava:
+            entrada = self._entradas.get(chave)
+            if entrada is None:
+                return None
+            if entrada[0] <= monotonic():
+                del self._entradas[chave]
+                return None
+            self._entradas.move_to_end(chave)
+            return entrada[1]
+
+    def guardar(self, chave: Hashable, valor: object) -> None:
+        agora = monotonic()
+        entradas = self._entradas
+        with self._trava:
+            entradas[chave] = (agora + self._validade, valor)
+            entradas.move_to_end(chave)
+            # As menos usadas ficam no início: descarta as vencidas que
+            # estiverem lá e, se ainda estiver cheio, as mais antigas
+            while entradas:
+                primeira = next(iter(entradas.values()))
+                if primeira[0] > agora and len(entradas) <= self._capacidade:
+                    break
+                entradas.popitem(last=False)
+
+    def limpar(self) -> None:
+        with self._trava:
+            self._entradas.clear()
@@ -0,0 +1,174 @@
+import csv
+import sys
+from collections import Counter
+from datetime import date
+from operator import itemgetter
+from time import perf_counter
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Type
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_corrente import ContaCorrente
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_poupanca import ContaPoupanca
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_repositorio import RepositorioContas
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_cpf import cpf_valido, validar_cpfs
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_registro_cpf import RegistroCpf
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+# Colunas esperadas no arquivo; `tipo` é opcional e vale 'corrente' se ausente
+COLUNAS = ('nome', 'cpf', 'data_nascimento', 'agencia', 'conta')
+COLUNA_TIPO = 'tipo'
+
+CLASSES_CONTA: Dict[str, Type[Conta]] = {
+    'corrente': ContaCorrente,
+    'poupanca': ContaPoupanca,
+}
+
+Linha = Tuple[str, str, str, str, str, str]  # COLUNAS + tipo
+
+
+class RelatorioImportacao(NamedTuple):
+    linhas: int
+    importadas: int
+    rejeitadas: Dict[str, int]  # motivo -> quantidade
+    segundos: float
+    pico_memoria_bytes: Optional[int]  # pico do processo; None se indisponível
+
+    @property
+    def linhas_por_segundo(self) -> float:
+        return self.linhas / self.segundos if self.segundos else 0.0
+
+
+def _pico_memoria() -> Optional[int]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss vem em KiB no Linux e em bytes no macOS
+    return pico if sys.platform == 'darwin' else pico * 1024
+
+
+def _validar_cpfs(cpfs: Sequence[str]) -> List[bool]:
+    # Valida o bloco inteiro de uma vez com NumPy; sem ele, CPF a CPF
+    try:
+        return validar_cpfs(cpfs).tolist()
+    except ImportError:
+        return [cpf_valido(cpf) for cpf in cpfs]
+
+
+def _blocos_csv(caminho: str, tamanho_bloco: int, codificacao: str) -> Iterator[List[Linha]]:
+    with open(caminho, newline='', encoding=codificacao) as arquivo:
+        leitor = csv.reader(arquivo)
+        cabecalho = next(leitor, None)
+        if cabecalho is None:
+            return
+        posicoes = _posicoes_colunas([coluna.strip() for coluna in cabecalho])
+        # Linhas curtas são completadas com campos vazios. Sem a coluna tipo,
+        # o tipo é sempre '' (não um campo a mais que a linha tenha)
+        largura = len(cabecalho)
+        if posicoes[-1] is None:
+            obrigatorias = itemgetter(*posicoes[:-1])
+
+            def selecionar(registro: List[str]) -> Linha:
+                return (*obrigatorias(registro), '')
+        else:
+            selecionar = itemgetter(*posicoes)
+        complemento = [''] * largura
+        bloco: List[Linha] = []
+        for registro in leitor:
+            if len(registro) < largura:
+                registro += complemento[len(registro):]
+            bloco.append(selecionar(registro))
+            if len(bloco) >= tamanho_bloco:
+                yield bloco
+                bloco = []
+        if bloco:
+            yield bloco
+
+
+def _blocos_parquet(caminho: str, tamanho_bloco: int) -> Iterator[List[Linha]]:
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as erro:
+        raise ImportError('A importação de Parquet requer o pyarrow (pip install pyarrow)') from erro
+    arquivo = pq.ParquetFile(caminho)
+    disponiveis = set(arquivo.schema_arrow.names)
+    colunas = [coluna for coluna in (*COLUNAS, COLUNA_TIPO) if coluna in disponiveis]
+    _posicoes_colunas(colunas)
+    for lote in arquivo.iter_batches(batch_size=tamanho_bloco, columns=colunas):
+        dados = lote.to_pydict()
+        valores = [[('' if valor is None else str(valor)) for valor in dados[coluna]] if coluna in dados
+                   else [''] * lote.num_rows
+                   for coluna in (*COLUNAS, COLUNA_TIPO)]
+        yield list(zip(*valores))
+
+
+def _posicoes_colunas(cabecalho: List[str]) -> List[Optional[int]]:
+    faltando = [coluna for coluna in COLUNAS if coluna not in cabecalho]
+    if faltando:
+        raise ValueError(f'Colunas obrigatórias ausentes: {", ".join(faltando)}')
+    return [cabecalho.index(coluna) if coluna in cabecalho else None for coluna in (*COLUNAS, COLUNA_TIPO)]
+
+
+def importar_blocos(blocos: Iterable[List[Linha]], repositorio: RepositorioContas,
+                    registro: RegistroCpf) -> RelatorioImportacao:
+    # Núcleo da importação, independente do formato do arquivo. Para cada
+    # bloco: valida os CPFs de uma vez, descarta os que já estavam no
+    # registro antes da importação, cria titulares e contas e só então
+    # registra os CPFs novos com um único carregar_em_lote. Linhas do mesmo
+    # CPF compartilham o mesmo Titular.
+    inicio = perf_counter()
+    rejeitadas: Counter = Counter()
+    titulares: Dict[str, Titular] = {}
+    linhas = 0
+    importadas = 0
+    for bloco in blocos:
+        linhas += len(bloco)
+        validos = _validar_cpfs([linha[1] for linha in bloco])
+        novos_cpfs: List[str] = []
+        for linha, valido in zip(bloco, validos):
+            nome, cpf, data_nascimento, agencia, numero, tipo = linha
+            if not valido:
+                rejeitadas['cpf_invalido'] += 1
+                continue
+            titular = titulares.get(cpf)
+            if titular is None:
+                if cpf in registro:
+                    rejeitadas['cpf_ja_cadastrado'] += 1
+                    continue
+                try:
+                    nascimento = date.fromisoformat(data_nascimento)
+                except ValueError:
+                    rejeitadas['data_invalida'] += 1
+                    continue
+            classe = CLASSES_CONTA.get(tipo or 'corrente')
+            if classe is None:
+                rejeitadas['tipo_invalido'] += 1
+                continue
+            if not agencia or not numero:
+                rejeitadas['conta_invalida'] += 1
+                continue
+            if (agencia, numero) in repositorio:
+                rejeitadas['conta_duplicada'] += 1
+                continue
+            if titular is None:
+                titular = titulares[cpf] = Titular(nome, cpf, nascimento)
+                novos_cpfs.append(cpf)
+            repositorio.adicionar(classe(titular, agencia, numero))
+            importadas += 1
+        registro.carregar_em_lote(novos_cpfs)
+    return RelatorioImportacao(linhas, importadas, dict(rejeitadas), perf_counter() - inicio, _pico_memoria())
+
+
+def importar_csv(caminho: str, repositorio: RepositorioContas, registro: RegistroCpf,
+                 tamanho_bloco: int = 10_000, codificacao: str = 'utf-8-sig') -> RelatorioImportacao:
+    # Lê o CSV em blocos de `tamanho_bloco` linhas: a memória usada não
+    # depende do tamanho do arquivo, só das contas criadas. 'utf-8-sig' lê
+    # UTF-8 com ou sem BOM (o Excel grava CSV com BOM).
+    return importar_blocos(_blocos_csv(caminho, tamanho_bloco, codificacao), repositorio, registro)
+
+
+def importar_parquet(caminho: str, repositorio: RepositorioContas, registro: RegistroCpf,
+                     tamanho_bloco: int = 10_000) -> RelatorioImportacao:
+    # Requer pyarrow; o arquivo é lido em lotes (row batches) de `tamanho_bloco`
+    return importar_blocos(_blocos_parquet(caminho, tamanho_bloco), repositorio, registro)
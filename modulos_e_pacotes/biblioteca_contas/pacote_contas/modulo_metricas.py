@@ -0,0 +1,253 @@
+import os
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from threading import Lock, Thread
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Optional, TextIO, Tuple, Type
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+
+# Bits de precisão dos baldes do histograma: valores abaixo de 2**BITS_PRECISAO
+# ns são exatos e os demais ficam em baldes com erro relativo < 2**-(BITS_PRECISAO - 1)
+# (1,6% com 7 bits), como no HdrHistogram.
+BITS_PRECISAO = 7
+
+# Limites (em segundos) dos baldes exportados para o Prometheus
+LIMITES_PROMETHEUS = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+                      1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 0.1, 1.0)
+
+TIPO_CONTEUDO_PROMETHEUS = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _indice(valor: int) -> int:
+    deslocamento = valor.bit_length() - BITS_PRECISAO
+    if deslocamento <= 0:
+        return valor
+    return (deslocamento << (BITS_PRECISAO - 1)) + (valor >> deslocamento)
+
+
+def _maior_valor(indice: int) -> int:
+    # Maior valor (ns) que cai no balde `indice`
+    if indice < 1 << BITS_PRECISAO:
+        return indice
+    deslocamento = (indice >> (BITS_PRECISAO - 1)) - 1
+    mantissa = indice - (deslocamento << (BITS_PRECISAO - 1))
+    return ((mantissa + 1) << deslocamento) - 1
+
+
+class HistogramaLatencia:
+    # Histograma de latências em ns com baldes log-lineares de tamanho fixo:
+    # registrar() é um cálculo de índice e um incremento, a memória não
+    # depende da quantidade de amostras e percentis têm erro relativo
+    # limitado por BITS_PRECISAO. Não é seguro entre threads; MetricasContas
+    # serializa as gravações.
+    __slots__ = ('_contagens', 'contagem', 'soma_ns', 'maximo_ns')
+
+    def __init__(self) -> None:
+        self.zerar()
+
+    def zerar(self) -> None:
+        self._contagens: List[int] = [0] * (_indice((1 << 63) - 1) + 1)
+        self.contagem: int = 0
+        self.soma_ns: int = 0
+        self.maximo_ns: int = 0
+
+    def registrar(self, duracao_ns: int) -> None:
+        deslocamento = duracao_ns.bit_length() - BITS_PRECISAO
+        if deslocamento <= 0:
+            self._contagens[duracao_ns] += 1
+        else:
+            self._contagens[(deslocamento << (BITS_PRECISAO - 1)) + (duracao_ns >> deslocamento)] += 1
+        self.contagem += 1
+        self.soma_ns += duracao_ns
+        if duracao_ns > self.maximo_ns:
+            self.maximo_ns = duracao_ns
+
+    def mesclar(self, outro: 'HistogramaLatencia') -> None:
+        self._contagens = [a + b for a, b in zip(self._contagens, outro._contagens)]
+        self.contagem += outro.contagem
+        self.soma_ns += outro.soma_ns
+        self.maximo_ns = max(self.maximo_ns, outro.maximo_ns)
+
+    def percentil(self, percentual: float) -> int:
+        # Limite superior (ns) do balde que contém o percentil pedido (0-100)
+        if not self.contagem:
+            return 0
+        alvo = max(1, -(-self.contagem * percentual // 100))
+        acumulado = 0
+        for indice, quantidade in enumerate(self._contagens):
+            acumulado += quantidade
+            if acumulado >= alvo:
+                return min(_maior_valor(indice), self.maximo_ns)
+        return self.maximo_ns
+
+    def acumulados(self, limites_ns: Tuple[int, ...]) -> List[int]:
+        # Quantidade de amostras <= cada limite, para baldes cumulativos.
+        # Um balde do histograma só conta se todo ele estiver abaixo do limite.
+        resultado = []
+        acumulado = indice = 0
+        for limite in limites_ns:
+            while indice < len(self._contagens) and _maior_valor(indice) <= limite:
+                acumulado += self._contagens[indice]
+                indice += 1
+            resultado.append(acumulado)
+        return resultado
+
+
+class MetricasContas:
+    # Contagens e histogramas de latência por operação das contas. Ativada com
+    # Conta.definir_metricas(MetricasContas()); com None (padrão) as contas não
+    # têm instrumentação nenhuma e o custo é zero.
+    def __init__(self) -> None:
+        self._trava: Lock = Lock()
+        self._latencias: Dict[str, HistogramaLatencia] = {}
+        self._falhas: Dict[str, int] = {}
+
+    def _histograma(self, operacao: str) -> HistogramaLatencia:
+        with self._trava:
+            histograma = self._latencias.get(operacao)
+            if histograma is None:
+                histograma = self._latencias[operacao] = HistogramaLatencia()
+            return histograma
+
+    def registrar(self, operacao: str, duracao_ns: int, sucesso: bool) -> None:
+        histograma = self._histograma(operacao)
+        with self._trava:
+            histograma.registrar(duracao_ns)
+            if not sucesso:
+                self._falhas[operacao] = self._falhas.get(operacao, 0) + 1
+
+    def latencia(self, operacao: str) -> HistogramaLatencia:
+        return self._latencias.get(operacao) or HistogramaLatencia()
+
+    def contagem(self, operacao: str, sucesso: Optional[bool] = None) -> int:
+        histograma = self._latencias.get(operacao)
+        total = histograma.contagem if histograma is not None else 0
+        falhas = self._falhas.get(operacao, 0)
+        if sucesso is None:
+            return total
+        return total - falhas if sucesso else falhas
+
+    def zerar(self) -> None:
+        # Os histogramas são zerados no lugar: as operações instrumentadas
+        # guardam referência a eles
+        with self._trava:
+            for histograma in self._latencias.values():
+                histograma.zerar()
+            self._falhas.clear()
+
+    def exportar_prometheus(self, destino: TextIO) -> None:
+        # Formato de exposição em texto do Prometheus (versão 0.0.4)
+        limites_ns = tuple(int(limite * 1e9) for limite in LIMITES_PROMETHEUS)
+        with self._trava:
+            resultados = sorted((operacao, sucesso, quantidade)
+                                for operacao, histograma in self._latencias.items()
+                                for sucesso, quantidade in ((False, self._falhas.get(operacao, 0)),
+                                                            (True, histograma.contagem - self._falhas.get(operacao, 0)))
+                                if quantidade)
+            latencias = sorted((operacao, histograma.contagem, histograma.soma_ns, histograma.acumulados(limites_ns))
+                               for operacao, histograma in self._latencias.items())
+        linhas = ['# HELP contas_operacoes_total Operações executadas nas contas.',
+                  '# TYPE contas_operacoes_total counter']
+        for operacao, sucesso, quantidade in resultados:
+            resultado = 'sucesso' if sucesso else 'falha'
+            linhas.append(f'contas_operacoes_total{{operacao="{operacao}",resultado="{resultado}"}} {quantidade}')
+        linhas += ['# HELP contas_operacao_latencia_segundos Latência das operações nas contas.',
+                   '# TYPE contas_operacao_latencia_segundos histogram']
+        for operacao, contagem, soma_ns, acumulados in latencias:
+            rotulo = f'operacao="{operacao}"'
+            for limite, acumulado in zip(LIMITES_PROMETHEUS, acumulados):
+                linhas.append(f'contas_operacao_latencia_segundos_bucket{{{rotulo},le="{limite:g}"}} {acumulado}')
+            linhas.append(f'contas_operacao_latencia_segundos_bucket{{{rotulo},le="+Inf"}} {contagem}')
+            linhas.append(f'contas_operacao_latencia_segundos_sum{{{rotulo}}} {soma_ns / 1e9:.9f}')
+            linhas.append(f'contas_operacao_latencia_segundos_count{{{rotulo}}} {contagem}')
+        destino.write('\n'.join(linhas) + '\n')
+
+    def gravar_prometheus(self, caminho: str) -> None:
+        # Para o textfile collector do node_exporter: o arquivo é substituído
+        # de uma vez, então o coletor nunca lê um arquivo pela metade.
+        temporario = caminho + '.tmp'
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            self.exportar_prometheus(arquivo)
+        os.replace(temporario, caminho)
+
+    def servir_prometheus(self, porta: int = 9464, endereco: str = '127.0.0.1') -> ThreadingHTTPServer:
+        # Expõe GET /metrics em uma thread daemon. Encerre com .shutdown().
+        metricas = self
+
+        class _Requisicao(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                texto = StringIO()
+                metricas.exportar_prometheus(texto)
+                corpo = texto.getvalue().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', TIPO_CONTEUDO_PROMETHEUS)
+                self.send_header('Content-Length', str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+
+            def log_message(self, *args) -> None:
+                pass
+
+        servidor = ThreadingHTTPServer((endereco, porta), _Requisicao)
+        Thread(target=servidor.serve_forever, daemon=True).start()
+        return servidor
+
+
+# Métodos originais substituídos pela instrumentação: (classe, nome) -> função
+_originais: Dict[Tuple[Type[Conta], str], Callable] = {}
+
+
+def _medir(funcao: Callable, operacao: str, metricas: MetricasContas) -> Callable:
+    # Tudo que o caminho quente usa é resolvido uma vez aqui
+    trava = metricas._trava
+    registrar = metricas._histograma(operacao).registrar
+    registrar_falha = metricas.registrar
+
+    @wraps(funcao)
+    def medida(self, *args, **kwargs):
+        # Só mede a versão do método que a classe da conta de fato usa. Assim
+        # a chamada via super() de uma subclasse que também foi instrumentada
+        # (ex.: ContaCorrenteSincronizada.deposito, que adiciona a trava) é
+        # medida uma vez só, pela externa.
+        if getattr(type(self), operacao) is not medida:
+            return funcao(self, *args, **kwargs)
+        inicio = perf_counter_ns()
+        resultado = funcao(self, *args, **kwargs)
+        duracao = perf_counter_ns() - inicio
+        if getattr(resultado, 'sucesso', True):
+            with trava:
+                registrar(duracao)
+        else:
+            registrar_falha(operacao, duracao, False)
+        return resultado
+    return medida
+
+
+def _subclasses(classe: Type[Conta]) -> List[Type[Conta]]:
+    classes = [classe]
+    for subclasse in classe.__subclasses__():
+        classes.extend(_subclasses(subclasse))
+    return classes
+
+
+def instrumentar(metricas: Optional[MetricasContas]) -> None:
+    # Envolve as operações de Conta.operacoes_medidas em todas as classes de
+    # conta já importadas (só onde cada classe define o método) ou, com None,
+    # restaura os métodos originais. Classes importadas depois só são medidas
+    # pelo que herdam; chame de novo para incluí-las.
+    for (classe, nome), original in _originais.items():
+        setattr(classe, nome, original)
+    _originais.clear()
+    if metricas is None:
+        return
+    for classe in _subclasses(Conta):
+        for nome in Conta.operacoes_medidas:
+            original = classe.__dict__.get(nome)
+            if original is not None:
+                _originais[(classe, nome)] = original
+                setattr(classe, nome, _medir(original, nome, metricas))
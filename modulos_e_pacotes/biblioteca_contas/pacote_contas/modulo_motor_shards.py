@@ -0,0 +1,292 @@
+import multiprocessing
+import os
+import zlib
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_corrente import ContaCorrente
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_extrato import novo_id_transacao, para_centavos
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_repositorio import RepositorioContas
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_resultado import Resultado
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+Chave = Tuple[str, str]
+Operacao = Tuple[str, str, str, float]  # (operacao, agencia, conta, valor)
+
+
+def shard_da_conta(agencia: str, conta: str, quantidade_shards: int) -> int:
+    # crc32 em vez de hash(): o hash de str muda a cada interpretador
+    # (PYTHONHASHSEED), e o shard de uma conta precisa ser estável.
+    return zlib.crc32(f'{agencia}/{conta}'.encode('utf-8')) % quantidade_shards
+
+
+class _Shard:
+    # Estado de um processo trabalhador: as contas do shard e as reservas das
+    # transferências entre shards ainda não concluídas. Roda em uma única
+    # thread, então as operações de um shard nunca se intercalam.
+    def __init__(self, diretorio_diario: Optional[str]) -> None:
+        self.contas: RepositorioContas = RepositorioContas()
+        # transação -> (conta, centavos, é débito, contraparte)
+        self.reservas: Dict[int, Tuple[Conta, int, bool, str]] = {}
+        # O diário herdado do processo pai (fork) não pode ser compartilhado:
+        # cada shard grava no seu próprio diretório, ou em nenhum.
+        self.diario = None
+        if diretorio_diario is not None:
+            from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_diario import DiarioContas
+
+            self.diario = DiarioContas(diretorio_diario)
+        Conta.definir_diario(self.diario)
+
+    def _conta(self, agencia: str, conta: str) -> Conta:
+        encontrada = self.contas.buscar(agencia, conta)
+        if encontrada is None:
+            raise KeyError(f'Conta inexistente: {agencia}/{conta}')
+        return encontrada
+
+    def abrir(self, classe: Type[Conta], titular: Titular, agencia: str, conta: str) -> None:
+        self.contas.adicionar(classe(titular, agencia, conta))
+
+    def lote(self, operacoes: Sequence[Operacao]) -> List[Resultado]:
+        # Agrupa por conta e aplica cada grupo com um único aplicar_lote,
+        # devolvendo os resultados na ordem recebida.
+        grupos: Dict[Chave, List[int]] = {}
+        for indice, (_, agencia, conta, _) in enumerate(operacoes):
+            grupos.setdefault((agencia, conta), []).append(indice)
+        # Valida tudo antes de aplicar: um erro não deixa o lote pela metade
+        contas = [self._conta(agencia, conta) for agencia, conta in grupos]
+        for conta, indices in zip(contas, grupos.values()):
+            for indice in indices:
+                if operacoes[indice][0] not in conta.operacoes_lote:
+                    raise ValueError(f'Operação inválida para {type(conta).__name__}: {operacoes[indice][0]}')
+        resultados: List[Any] = [None] * len(operacoes)
+        for conta, indices in zip(contas, grupos.values()):
+            movimentos = [(operacoes[indice][0], operacoes[indice][3]) for indice in indices]
+            for indice, resultado in zip(indices, conta.aplicar_lote(movimentos)):
+                resultados[indice] = resultado
+        return resultados
+
+    def saldo(self, agencia: str, conta: str) -> int:
+        return self._conta(agencia, conta)._saldo
+
+    def transferencia(self, origem: Chave, destino: Chave, valor: float) -> Resultado:
+        # Origem e destino no mesmo shard: transferência local, sem 2PC
+        conta_origem = self._conta(*origem)
+        conta_destino = self._conta(*destino)
+        if not isinstance(conta_origem, ContaCorrente):
+            raise TypeError(f'{type(conta_origem).__name__} não faz transferências')
+        return conta_origem.transferencia(valor, conta_destino)
+
+    # Protocolo de duas fases (transferência entre shards): os dois shards
+    # preparam e só então o coordenador manda confirmar ou desfazer.
+
+    def preparar_debito(self, transacao: int, agencia: str, conta: str, centavos: int, contraparte: str) -> bool:
+        # Retira o valor do saldo e o mantém reservado: nenhuma outra operação
+        # do shard consegue gastá-lo até a transação terminar.
+        conta_origem = self._conta(agencia, conta)
+        if not isinstance(conta_origem, ContaCorrente):
+            raise TypeError(f'{type(conta_origem).__name__} não faz transferências')
+        if not conta_origem._saida_permitida(centavos, conta_origem._saldo, 'Transferencia'):
+            return False
+        conta_origem._saldo -= centavos
+        self.reservas[transacao] = (conta_origem, centavos, True, contraparte)
+        return True
+
+    def preparar_credito(self, transacao: int, agencia: str, conta: str, centavos: int, contraparte: str) -> bool:
+        self.reservas[transacao] = (self._conta(agencia, conta), centavos, False, contraparte)
+        return True
+
+    def confirmar(self, transacao: int) -> int:
+        # O débito já saiu do saldo no preparo; falta o extrato, com a mesma
+        # transação nos dois shards. Retorna o saldo final da conta.
+        conta, centavos, debito, contraparte = self.reservas.pop(transacao)
+        if not debito:
+            conta._saldo += centavos
+        conta._adicionar_extrato(tipo='S' if debito else 'E', centavos=centavos, transacao=transacao,
+                                 contraparte=contraparte)
+        return conta._saldo
+
+    def desfazer(self, transacao: int) -> None:
+        reserva = self.reservas.pop(transacao, None)
+        if reserva is not None:
+            conta, centavos, debito, _ = reserva
+            if debito:
+                conta._saldo += centavos
+
+    def quantidade(self) -> int:
+        return len(self.contas)
+
+    def encerrar(self) -> None:
+        if self.diario is not None:
+            self.diario.fechar()
+
+
+def _executar_shard(conexao: Connection, diretorio_diario: Optional[str]) -> None:
+    # Laço do processo trabalhador: recebe (método, argumentos) e responde
+    # (True, retorno) ou (False, exceção).
+    shard = _Shard(diretorio_diario)
+    while True:
+        try:
+            metodo, argumentos = conexao.recv()
+        except EOFError:
+            break
+        try:
+            resposta = (True, getattr(shard, metodo)(*argumentos))
+        except Exception as erro:
+            resposta = (False, erro)
+        conexao.send(resposta)
+        if metodo == 'encerrar':
+            break
+    conexao.close()
+
+
+class MotorContasShards:
+    # Distribui as contas entre `quantidade_shards` processos pelo crc32 de
+    # (agencia, conta), para usar vários núcleos apesar do GIL. Cada conta
+    # vive em um único processo; depósitos, saques e pagamentos vão direto ao
+    # shard dono da conta.
+    #
+    # Transferências entre shards usam duas fases coordenadas por este
+    # objeto: o shard de origem reserva o valor e o de destino confirma que a
+    # conta existe; se os dois aceitarem, ambos gravam o movimento, senão a
+    # reserva é devolvida. O coordenador roda no processo principal: se ele
+    # morrer no meio de uma transferência, os trabalhadores morrem juntos.
+    #
+    # Uma chamada por operação custa uma ida e volta entre processos; para
+    # vazão use executar_lote, que envia um único lote a cada shard e deixa
+    # todos trabalhando em paralelo.
+    def __init__(self, quantidade_shards: Optional[int] = None, diretorio_diario: Optional[str] = None) -> None:
+        self._quantidade: int = quantidade_shards or os.cpu_count() or 1
+        self._conexoes: List[Connection] = []
+        self._processos: List[multiprocessing.Process] = []
+        for indice in range(self._quantidade):
+            local, remota = multiprocessing.Pipe()
+            diretorio = None if diretorio_diario is None else os.path.join(diretorio_diario, f'shard-{indice:03d}')
+            processo = multiprocessing.Process(target=_executar_shard, args=(remota, diretorio), daemon=True)
+            processo.start()
+            remota.close()
+            self._conexoes.append(local)
+            self._processos.append(processo)
+
+    @property
+    def quantidade_shards(self) -> int:
+        return self._quantidade
+
+    def _shard(self, agencia: str, conta: str) -> int:
+        return shard_da_conta(agencia, conta, self._quantidade)
+
+    def _enviar(self, shard: int, metodo: str, *argumentos: Any) -> None:
+        self._conexoes[shard].send((metodo, argumentos))
+
+    def _receber(self, shard: int) -> Any:
+        ok, retorno = self._conexoes[shard].recv()
+        if not ok:
+            raise retorno
+        return retorno
+
+    def _chamar(self, shard: int, metodo: str, *argumentos: Any) -> Any:
+        self._enviar(shard, metodo, *argumentos)
+        return self._receber(shard)
+
+    def abrir_conta(self, classe: Type[Conta], titular: Titular, agencia: str, conta: str) -> None:
+        self._chamar(self._shard(agencia, conta), 'abrir', classe, titular, agencia, conta)
+
+    def deposito(self, agencia: str, conta: str, valor: float) -> Resultado:
+        return self._chamar(self._shard(agencia, conta), 'lote', [('deposito', agencia, conta, valor)])[0]
+
+    def saque(self, agencia: str, conta: str, valor: float) -> Resultado:
+        return self._chamar(self._shard(agencia, conta), 'lote', [('saque', agencia, conta, valor)])[0]
+
+    def pagamento(self, agencia: str, conta: str, valor: float) -> Resultado:
+        return self._chamar(self._shard(agencia, conta), 'lote', [('pagamento', agencia, conta, valor)])[0]
+
+    def saldo(self, agencia: str, conta: str) -> float:
+        return self._chamar(self._shard(agencia, conta), 'saldo', agencia, conta) / 100
+
+    def executar_lote(self, operacoes: Iterable[Operacao]) -> List[Resultado]:
+        # (operacao, agencia, conta, valor) com operacao em operacoes_lote da
+        # conta. Os resultados voltam na ordem das operações. Uma conta
+        # inexistente ou operação inválida gera exceção e o lote do shard
+        # onde ela ocorreu não é aplicado.
+        quantidade = self._quantidade
+        por_shard: List[List[Operacao]] = [[] for _ in range(quantidade)]
+        posicoes: List[List[int]] = [[] for _ in range(quantidade)]
+        total = 0
+        for operacao in operacoes:
+            shard = shard_da_conta(operacao[1], operacao[2], quantidade)
+            por_shard[shard].append(operacao)
+            posicoes[shard].append(total)
+            total += 1
+        ativos = [shard for shard in range(quantidade) if por_shard[shard]]
+        for shard in ativos:
+            self._enviar(shard, 'lote', por_shard[shard])
+        resultados: List[Any] = [None] * total
+        erro: Optional[Exception] = None
+        for shard in ativos:
+            # Lê todas as respostas antes de propagar um erro, para não deixar
+            # respostas pendentes nas conexões
+            try:
+                for posicao, resultado in zip(posicoes[shard], self._receber(shard)):
+                    resultados[posicao] = resultado
+            except Exception as falha:
+                erro = erro or falha
+        if erro is not None:
+            raise erro
+        return resultados
+
+    def transferencia(self, origem: Chave, destino: Chave, valor: float) -> Resultado:
+        nome_operacao = 'Transferencia'
+        shard_origem = self._shard(*origem)
+        shard_destino = self._shard(*destino)
+        if shard_origem == shard_destino:
+            return self._chamar(shard_origem, 'transferencia', origem, destino, valor)
+        centavos = para_centavos(valor)
+        if centavos <= 0:
+            return Resultado(False, nome_operacao, self._chamar(shard_origem, 'saldo', *origem))
+        transacao = novo_id_transacao()
+        # Fase 1: os dois shards preparam em paralelo
+        self._enviar(shard_origem, 'preparar_debito', transacao, *origem, centavos, '/'.join(destino))
+        self._enviar(shard_destino, 'preparar_credito', transacao, *destino, centavos, '/'.join(origem))
+        votos = []
+        erro: Optional[Exception] = None
+        for shard in (shard_origem, shard_destino):
+            try:
+                votos.append(self._receber(shard))
+            except Exception as falha:
+                votos.append(False)
+                erro = erro or falha
+        # Fase 2: confirma nos dois ou desfaz nos dois
+        if all(votos):
+            self._enviar(shard_destino, 'confirmar', transacao)
+            saldo = self._chamar(shard_origem, 'confirmar', transacao)
+            self._receber(shard_destino)
+            return Resultado(True, nome_operacao, saldo)
+        self._enviar(shard_destino, 'desfazer', transacao)
+        self._chamar(shard_origem, 'desfazer', transacao)
+        self._receber(shard_destino)
+        if erro is not None:
+            raise erro
+        return Resultado(False, nome_operacao, self._chamar(shard_origem, 'saldo', *origem))
+
+    def __len__(self) -> int:
+        for shard in range(self._quantidade):
+            self._enviar(shard, 'quantidade')
+        return sum(self._receber(shard) for shard in range(self._quantidade))
+
+    def encerrar(self) -> None:
+        for shard in range(len(self._conexoes)):
+            try:
+                self._chamar(shard, 'encerrar')
+            except (EOFError, OSError):
+                pass
+            self._conexoes[shard].close()
+        for processo in self._processos:
+            processo.join()
+        self._conexoes = []
+        self._processos = []
+
+    def __enter__(self) -> 'MotorContasShards':
+        return self
+
+    def __exit__(self, *excecao: Any) -> None:
+        self.encerrar()
@@ -0,0 +1,12 @@
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+
+
+class ContaPoupanca(Conta):
+    __slots__ = ()
+
+    # Saques acima de R$ 100,00 estão congelados na poupança
+    LIMITE_SAQUE_CENTAVOS = 10_000
+
+    def _saida_permitida(self, centavos: int, saldo: int, nome_operacao: str) -> bool:
+        # Vale para saque e aplicar_lote, que passam por esta mesma regra
+        return centavos <= self.LIMITE_SAQUE_CENTAVOS and super()._saida_permitida(centavos, saldo, nome_operacao)
@@ -0,0 +1,148 @@
+from datetime import date, datetime, time, timedelta
+from typing import TYPE_CHECKING, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Union
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_extrato import Movimento, formatar_centavos
+
+if TYPE_CHECKING:
+    from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+
+Data = Union[date, datetime]
+
+FORMATOS = ('texto', 'csv', 'jsonl')
+
+
+class Pagina(NamedTuple):
+    movimentos: List[Movimento]
+    cursor: Optional[int]  # passe para a próxima chamada; None quando não há mais páginas
+
+
+def para_instante(data: Data, fim: bool = False) -> int:
+    # datetime é usado como está. Uma date vira meia-noite (horário local) e,
+    # como fim do intervalo, inclui o dia inteiro.
+    if not isinstance(data, datetime):
+        data = datetime.combine(data + timedelta(days=1) if fim else data, time.min)
+    segundos = int(data.replace(microsecond=0).timestamp())
+    return segundos * 1_000_000_000 + data.microsecond * 1_000
+
+
+def data_hora(movimento: Movimento) -> datetime:
+    return datetime.fromtimestamp(movimento.instante / 1_000_000_000)
+
+
+def _intervalo(conta: 'Conta', inicio: Optional[Data], fim: Optional[Data]) -> Tuple[int, int]:
+    extrato = conta._extrato
+    primeiro = 0 if inicio is None else extrato.posicao(para_instante(inicio))
+    ultimo = len(extrato) if fim is None else extrato.posicao(para_instante(fim, fim=True))
+    return primeiro, ultimo
+
+
+def movimentos(conta: 'Conta', inicio: Optional[Data] = None, fim: Optional[Data] = None) -> Iterator[Movimento]:
+    # Gera os movimentos do período um a um, sem copiar o extrato
+    primeiro, ultimo = _intervalo(conta, inicio, fim)
+    yield from conta._extrato.iterar(primeiro, ultimo)
+
+
+def paginar(conta: 'Conta', inicio: Optional[Data] = None, fim: Optional[Data] = None,
+            tamanho_pagina: int = 100, cursor: Optional[int] = None) -> Pagina:
+    primeiro, ultimo = _intervalo(conta, inicio, fim)
+    if cursor is not None:
+        primeiro = max(primeiro, cursor)
+    final_pagina = min(primeiro + tamanho_pagina, ultimo)
+    pagina = list(conta._extrato.iterar(primeiro, final_pagina))
+    return Pagina(pagina, final_pagina if final_pagina < ultimo else None)
+
+
+def _cabecalho_texto(conta: 'Conta') -> List[str]:
+    return [
+        f'Agencia: {conta.agencia}\n',
+        f'Conta: {conta.conta}\n',
+        f'Titular: {conta.titular.nome_titular}\n',
+        f'CPF do titular: {conta.titular.cpf}\n',
+        f'Saldo: R$ {formatar_centavos(conta._saldo)}\n',
+    ]
+
+
+def _linha_texto(movimento: Movimento) -> str:
+    return f'\t{movimento.tipo}: R$ {movimento.valor_formatado}\n'
+
+
+# Caracteres que obrigam a pôr o campo entre aspas. O módulo csv com
+# lineterminator='\n' não põe aspas em um campo só por ele ter '\r', e um
+# leitor em modo universal trataria o '\r' como fim de linha.
+_ESPECIAIS_CSV = frozenset(',"\r\n')
+
+
+def _linha_csv(movimento: Movimento) -> str:
+    # Só a contraparte pode ter caracteres especiais; os demais campos são
+    # números, datas e 'E'/'S'
+    contraparte = movimento.contraparte
+    if not _ESPECIAIS_CSV.isdisjoint(contraparte):
+        contraparte = '"' + contraparte.replace('"', '""') + '"'
+    return (f'{movimento.tipo},{movimento.valor_formatado},{data_hora(movimento).isoformat()},'
+            f'{movimento.transacao},{contraparte}\n')
+
+
+# csv e json só são importados quando esses formatos são usados: o extrato
+# em texto é o único renderizador carregado junto com Conta.
+def _linha_jsonl(movimento: Movimento) -> str:
+    import json
+
+    return json.dumps({
+        'tipo': movimento.tipo,
+        'valor': movimento.valor_formatado,
+        'centavos': movimento.centavos,
+        'instante': data_hora(movimento).isoformat(),
+        'transacao': movimento.transacao,
+        'contraparte': movimento.contraparte,
+    }) + '\n'
+
+
+def _cabecalho_csv(conta: 'Conta') -> List[str]:
+    import csv
+    import io
+
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer, lineterminator='\n')
+    escritor.writerow(['agencia', 'conta', 'titular', 'cpf', 'saldo'])
+    escritor.writerow([conta.agencia, conta.conta, conta.titular.nome_titular, conta.titular.cpf, formatar_centavos(conta._saldo)])
+    escritor.writerow(['tipo', 'valor', 'instante', 'transacao', 'contraparte'])
+    return [buffer.getvalue()]
+
+
+def _cabecalho_jsonl(conta: 'Conta') -> List[str]:
+    import json
+
+    return [json.dumps({
+        'agencia': conta.agencia,
+        'conta': conta.conta,
+        'titular': conta.titular.nome_titular,
+        'cpf': conta.titular.cpf,
+        'saldo': formatar_centavos(conta._saldo),
+    }) + '\n']
+
+
+_RENDERIZADORES = {
+    'texto': (_cabecalho_texto, _linha_texto),
+    'csv': (_cabecalho_csv, _linha_csv),
+    'jsonl': (_cabecalho_jsonl, _linha_jsonl),
+}
+
+
+def escrever(conta: 'Conta', destino: TextIO, formato: str = 'texto', inicio: Optional[Data] = None,
+             fim: Optional[Data] = None, tamanho_bloco: int = 1000) -> int:
+    # Escreve o extrato em `destino` (qualquer objeto com write) em blocos de
+    # `tamanho_bloco` linhas. Retorna a quantidade de movimentos escritos.
+    if formato not in _RENDERIZADORES:
+        raise ValueError(f'Formato de extrato inválido: {formato}. Use um de {FORMATOS}')
+    cabecalho, linha = _RENDERIZADORES[formato]
+    bloco = cabecalho(conta)
+    quantidade = 0
+    for movimento in movimentos(conta, inicio, fim):
+        bloco.append(linha(movimento))
+        quantidade += 1
+        if len(bloco) >= tamanho_bloco:
+            destino.write(''.join(bloco))
+            bloco = []
+    if bloco:
+        destino.write(''.join(bloco))
+    return quantidade
@@ -0,0 +1,55 @@
+# Requer NumPy (via DrexArray). Fica em um módulo separado para que
+# `pacote_contas` continue importável sem ele.
+
+from time import time_ns
+from typing import Iterable, List, NamedTuple
+
+import numpy as np
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_extrato import novo_id_transacao, para_centavos
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_poupanca import ContaPoupanca
+from modulos_e_pacotes.biblioteca_contas.pacote_drex.modulo_drex_array import DrexArray
+
+
+class ResumoRendimento(NamedTuple):
+    contas: int
+    juros_centavos: int
+    tarifas_centavos: int
+
+
+def aplicar_rendimento_mensal(contas: Iterable[Conta], taxa_mensal: float, tarifa: float = 0.0) -> ResumoRendimento:
+    # Credita os juros do mês (taxa_mensal, ex.: 0.005 para 0,5%) e debita a
+    # tarifa fixa de todas as ContaPoupanca de `contas`; as demais são
+    # ignoradas. Os saldos são calculados de uma vez em um DrexArray, com
+    # arredondamento bancário, e a tarifa nunca deixa o saldo negativo.
+    # Cada conta recebe seus movimentos em um único Extrato.estender, todos
+    # com o mesmo instante.
+    if taxa_mensal < 0 or tarifa < 0:
+        raise ValueError('Taxa e tarifa não podem ser negativas')
+    poupancas: List[ContaPoupanca] = [conta for conta in contas if isinstance(conta, ContaPoupanca)]
+    saldos = DrexArray.de_centavos(np.fromiter((conta._saldo for conta in poupancas), dtype=np.int64, count=len(poupancas)))
+    juros = saldos * taxa_mensal
+    tarifas = np.minimum(para_centavos(tarifa), (saldos + juros).centavos)
+    novos_saldos = (saldos + juros).centavos - tarifas
+
+    instante = time_ns()
+    diario = Conta.diario
+    for conta, credito, debito, novo_saldo in zip(poupancas, juros.centavos.tolist(), tarifas.tolist(),
+                                                   novos_saldos.tolist()):
+        tipos = []
+        valores = []
+        if credito > 0:
+            tipos.append('E')
+            valores.append(credito)
+        if debito > 0:
+            tipos.append('S')
+            valores.append(debito)
+        if not tipos:
+            continue
+        transacoes = [novo_id_transacao() for _ in tipos]
+        conta._extrato.estender(tipos, valores, [instante] * len(tipos), transacoes)
+        if diario is not None:
+            diario.registrar_lote(conta, tipos, valores, instante, transacoes)
+        conta._saldo = novo_saldo
+    return ResumoRendimento(len(poupancas), int(juros.centavos.sum()), int(tarifas.sum()))
@@ -0,0 +1,88 @@
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+
+Chave = Tuple[str, str]
+
+
+class RepositorioContas:
+    # Índices das contas em memória:
+    # - (agencia, conta) -> Conta, para busca direta em O(1);
+    # - agencia -> números de conta ordenados, para varrer uma agência por faixa;
+    # - cpf do titular -> contas daquele titular.
+    # A lista de uma agência só é reordenada na próxima varredura quando
+    # recebe um número fora de ordem; inserções em ordem crescente são O(1).
+    def __init__(self) -> None:
+        self._por_chave: Dict[Chave, Conta] = {}
+        self._por_agencia: Dict[str, List[str]] = {}
+        self._desordenadas: Set[str] = set()
+        self._por_cpf: Dict[str, List[Conta]] = {}
+
+    def _numeros_ordenados(self, agencia: str) -> List[str]:
+        numeros = self._por_agencia.get(agencia, [])
+        if agencia in self._desordenadas:
+            numeros.sort()
+            self._desordenadas.discard(agencia)
+        return numeros
+
+    def adicionar(self, conta: Conta) -> None:
+        chave = (conta.agencia, conta.conta)
+        if chave in self._por_chave:
+            raise ValueError(f'Conta já cadastrada: agência {conta.agencia}, conta {conta.conta}')
+        self._por_chave[chave] = conta
+        numeros = self._por_agencia.setdefault(conta.agencia, [])
+        if numeros and conta.conta < numeros[-1]:
+            self._desordenadas.add(conta.agencia)
+        numeros.append(conta.conta)
+        self._por_cpf.setdefault(conta.titular.cpf, []).append(conta)
+
+    def remover(self, agencia: str, conta: str) -> Conta:
+        removida = self._por_chave.pop((agencia, conta))
+        numeros = self._numeros_ordenados(agencia)
+        del numeros[bisect_left(numeros, conta)]
+        if not numeros:
+            del self._por_agencia[agencia]
+        contas_titular = self._por_cpf[removida.titular.cpf]
+        contas_titular.remove(removida)
+        if not contas_titular:
+            del self._por_cpf[removida.titular.cpf]
+        return removida
+
+    def alterar_numero(self, agencia: str, conta: str, nova_conta: str) -> None:
+        # Conta.conta tem setter; a troca precisa passar pelo repositório
+        # para que os índices continuem válidos.
+        if (agencia, nova_conta) in self._por_chave:
+            raise ValueError(f'Conta já cadastrada: agência {agencia}, conta {nova_conta}')
+        objeto = self.remover(agencia, conta)
+        objeto.conta = nova_conta
+        self.adicionar(objeto)
+
+    def buscar(self, agencia: str, conta: str) -> Optional[Conta]:
+        return self._por_chave.get((agencia, conta))
+
+    def buscar_por_cpf(self, cpf: str) -> List[Conta]:
+        return list(self._por_cpf.get(cpf, ()))
+
+    def agencias(self) -> List[str]:
+        return sorted(self._por_agencia)
+
+    def contas_da_agencia(self, agencia: str, inicio: Optional[str] = None, fim: Optional[str] = None) -> Iterator[Conta]:
+        # Contas da agência com número em [inicio, fim), em ordem crescente
+        numeros = self._numeros_ordenados(agencia)
+        primeiro = 0 if inicio is None else bisect_left(numeros, inicio)
+        ultimo = len(numeros) if fim is None else bisect_left(numeros, fim)
+        # Percorre uma cópia da faixa: o repositório pode mudar durante a varredura
+        for numero in numeros[primeiro:ultimo]:
+            conta = self._por_chave.get((agencia, numero))
+            if conta is not None:
+                yield conta
+
+    def __contains__(self, chave: Chave) -> bool:
+        return chave in self._por_chave
+
+    def __len__(self) -> int:
+        return len(self._por_chave)
+
+    def __iter__(self) -> Iterator[Conta]:
+        return iter(self._por_chave.values())
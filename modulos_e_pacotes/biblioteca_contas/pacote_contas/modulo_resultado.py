@@ -0,0 +1,60 @@
+import sys
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import List, NamedTuple, Optional, TextIO
+
+
+class Resultado(NamedTuple):
+    sucesso: bool
+    operacao: str
+    saldo_centavos: int
+
+    @property
+    def saldo(self) -> float:
+        return self.saldo_centavos / 100
+
+    @property
+    def mensagem(self) -> str:
+        if self.sucesso:
+            return f'Operação realizada com sucesso. Operação: {self.operacao}'
+        return f'Falha ao realizar operação. Operação: {self.operacao}'
+
+
+class Notificador(ABC):
+    @abstractmethod
+    def notificar(self, resultado: Resultado) -> None:
+        ...
+
+    def descarregar(self) -> None:
+        pass
+
+
+class NotificadorPrint(Notificador):
+    # Comportamento original: uma linha no stdout por operação
+    def notificar(self, resultado: Resultado) -> None:
+        print(resultado.mensagem)
+
+
+class NotificadorBuffer(Notificador):
+    # Acumula as mensagens e escreve no destino em blocos, com uma única
+    # chamada de write a cada `tamanho_buffer` mensagens.
+    def __init__(self, destino: Optional[TextIO] = None, tamanho_buffer: int = 1000) -> None:
+        self._destino: Optional[TextIO] = destino
+        self._tamanho_buffer: int = tamanho_buffer
+        self._mensagens: List[str] = []
+        self._trava: Lock = Lock()
+
+    def notificar(self, resultado: Resultado) -> None:
+        mensagem = resultado.mensagem
+        with self._trava:
+            self._mensagens.append(mensagem)
+            cheio = len(self._mensagens) >= self._tamanho_buffer
+        if cheio:
+            self.descarregar()
+
+    def descarregar(self) -> None:
+        with self._trava:
+            mensagens, self._mensagens = self._mensagens, []
+        if mensagens:
+            destino = self._destino if self._destino is not None else sys.stdout
+            destino.write('\n'.join(mensagens) + '\n')
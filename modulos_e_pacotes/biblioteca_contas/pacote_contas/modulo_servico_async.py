@@ -0,0 +1,93 @@
+import asyncio
+from typing import Dict, List, Set, Tuple
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_corrente import ContaCorrente
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_extrato import Movimento
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_resultado import Resultado
+
+Chave = Tuple[str, str]
+
+
+class ServicoContasAsync:
+    # Camada asyncio sobre Conta/ContaCorrente:
+    # - uma asyncio.Lock por conta (agencia, conta);
+    # - depósitos, saques e pagamentos feitos na mesma conta enquanto um lote
+    #   ainda não foi aplicado são agrupados e aplicados juntos com
+    #   Conta.aplicar_lote (coalescência para contas muito acessadas);
+    # - no máximo `max_pendentes` operações em andamento; as demais aguardam
+    #   (backpressure).
+    # Para não bloquear o event loop, prefira um NotificadorBuffer (ou nenhum
+    # notificador, o padrão) a um NotificadorPrint.
+    def __init__(self, max_pendentes: int = 10_000) -> None:
+        self._limite: asyncio.Semaphore = asyncio.Semaphore(max_pendentes)
+        self._travas: Dict[Chave, asyncio.Lock] = {}
+        self._pendentes: Dict[Chave, List[Tuple[str, float, asyncio.Future]]] = {}
+        self._tarefas: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def _chave(conta: Conta) -> Chave:
+        return (conta.agencia, conta.conta)
+
+    def _trava(self, conta: Conta) -> asyncio.Lock:
+        chave = self._chave(conta)
+        trava = self._travas.get(chave)
+        if trava is None:
+            trava = self._travas[chave] = asyncio.Lock()
+        return trava
+
+    async def _enfileirar(self, conta: Conta, operacao: str, valor: float) -> Resultado:
+        if operacao not in conta.operacoes_lote:
+            raise ValueError(f'Operação inválida para {type(conta).__name__}: {operacao}')
+        async with self._limite:
+            loop = asyncio.get_running_loop()
+            futuro = loop.create_future()
+            chave = self._chave(conta)
+            pendentes = self._pendentes.get(chave)
+            if pendentes is None:
+                pendentes = self._pendentes[chave] = []
+                tarefa = loop.create_task(self._aplicar_pendentes(conta, chave))
+                self._tarefas.add(tarefa)
+                tarefa.add_done_callback(self._tarefas.discard)
+            pendentes.append((operacao, valor, futuro))
+            return await futuro
+
+    async def _aplicar_pendentes(self, conta: Conta, chave: Chave) -> None:
+        async with self._trava(conta):
+            pendentes = self._pendentes.pop(chave)
+            try:
+                resultados = conta.aplicar_lote([(operacao, valor) for operacao, valor, _ in pendentes])
+            except Exception as erro:
+                for _, _, futuro in pendentes:
+                    if not futuro.done():
+                        futuro.set_exception(erro)
+                return
+            for (_, _, futuro), resultado in zip(pendentes, resultados):
+                if not futuro.done():
+                    futuro.set_result(resultado)
+
+    async def deposito(self, conta: Conta, valor: float) -> Resultado:
+        return await self._enfileirar(conta, 'deposito', valor)
+
+    async def saque(self, conta: Conta, valor: float) -> Resultado:
+        return await self._enfileirar(conta, 'saque', valor)
+
+    async def pagamento(self, conta: ContaCorrente, valor: float) -> Resultado:
+        return await self._enfileirar(conta, 'pagamento', valor)
+
+    async def transferencia(self, conta_origem: ContaCorrente, conta_destino: Conta, valor: float) -> Resultado:
+        async with self._limite:
+            if self._chave(conta_origem) == self._chave(conta_destino):
+                async with self._trava(conta_origem):
+                    return conta_origem.transferencia(valor, conta_destino)
+            # Mesma ordem de aquisição em todas as transferências: sem deadlock
+            primeira, segunda = sorted((conta_origem, conta_destino), key=self._chave)
+            async with self._trava(primeira), self._trava(segunda):
+                return conta_origem.transferencia(valor, conta_destino)
+
+    async def saldo(self, conta: Conta) -> float:
+        return conta.saldo
+
+    async def extrato(self, conta: Conta) -> List[Movimento]:
+        async with self._trava(conta):
+            return list(conta._extrato)
@@ -0,0 +1,77 @@
+from datetime import date
+from threading import RLock
+from typing import Iterable, List, Optional, TextIO, Tuple
+
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_contabase import Conta
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_corrente import ContaCorrente
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_relatorio_extrato import Data
+from modulos_e_pacotes.biblioteca_contas.pacote_contas.modulo_resultado import Resultado
+from modulos_e_pacotes.biblioteca_contas.pacote_titulares.modulo_titular import Titular
+
+
+def _ordem_trava(conta: Conta) -> Tuple[str, str, int]:
+    # Ordem global e determinística de aquisição das travas; o id desempata
+    # contas distintas com a mesma agência/conta.
+    return (conta.agencia, conta.conta, id(conta))
+
+
+class ContaCorrenteSincronizada(ContaCorrente):
+    # ContaCorrente segura para uso entre threads: cada conta tem sua própria
+    # trava e a transferência trava origem e destino sempre na mesma ordem,
+    # o que evita deadlock entre transferências cruzadas (A->B e B->A).
+    __slots__ = ('_trava',)
+
+    def __init__(self, titular: Titular, agencia: str, conta: str) -> None:
+        super().__init__(titular, agencia, conta)
+        self._trava: RLock = RLock()
+
+    # A consulta e a gravação da chave de idempotência ficam dentro da trava,
+    # então duas repetições simultâneas da mesma requisição aplicam uma vez só.
+
+    def deposito(self, valor: float, chave: Optional[str] = None) -> Resultado:
+        with self._trava:
+            return super().deposito(valor, chave)
+
+    def saque(self, valor: float, chave: Optional[str] = None) -> Resultado:
+        with self._trava:
+            return super().saque(valor, chave)
+
+    def pagamento(self, valor: float, chave: Optional[str] = None) -> Resultado:
+        with self._trava:
+            return super().pagamento(valor, chave)
+
+    def aplicar_lote(self, movimentos: Iterable[Tuple[str, float]], chave: Optional[str] = None) -> List[Resultado]:
+        with self._trava:
+            return super().aplicar_lote(movimentos, chave)
+
+    def _receber_transferencia(self, centavos: int, transacao: int, origem: Conta) -> None:
+        with self._trava:
+            super()._receber_transferencia(centavos, transacao, origem)
+
+    def transferencia(self, valor: float, conta_destino: Conta, chave: Optional[str] = None) -> Resultado:
+        trava_destino = getattr(conta_destino, '_trava', None)
+        if trava_destino is None or conta_destino is self:
+            with self._trava:
+                return super().transferencia(valor, conta_destino, chave)
+        primeira, segunda = sorted((self, conta_destino), key=_ordem_trava)
+        with primeira._trava, segunda._trava:
+            return super().transferencia(valor, conta_destino, chave)
+
+    # Leituras do extrato também ficam sob a trava: uma escrita preenche as
+    # colunas uma de cada vez e um leitor sem a trava veria a linha pela metade.
+
+    def saldo_em(self, data: Data) -> float:
+        with self._trava:
+            return super().saldo_em(data)
+
+    def saldo_medio(self, inicio: date, fim: date) -> float:
+        with self._trava:
+            return super().saldo_medio(inicio, fim)
+
+    def arquivar_historico(self, caminho: str, manter: int = 1000) -> int:
+        with self._trava:
+            return super().arquivar_historico(caminho, manter)
+
+    def extrato(self, destino: Optional[TextIO] = None) -> None:
+        with self._trava:
+            super().extrato(destino)
@@ -0,0 +1,11 @@
+from modulos_e_pacotes.biblioteca_contas._importacao_tardia import exportacoes_sob_demanda
+
+# DrexArray depende do NumPy, que só é carregado quando o nome é acessado.
+_EXPORTACOES = {
+    'Drex': '.modulo_drex',
+    'DrexArray': '.modulo_drex_array',
+}
+
+__all__ = list(_EXPORTACOES)
+
+__getattr__, __dir__ = exportacoes_sob_demanda(__name__, _EXPORTACOES)
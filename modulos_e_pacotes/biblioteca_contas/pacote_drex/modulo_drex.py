@@ -0,0 +1,214 @@
+from decimal import Decimal
+from fractions import Fraction
+from typing import Iterable, List, Optional, Union
+
+Numero = Union[int, float, Decimal, Fraction]
+
+# Faixa de valores (em centavos) reaproveitados em vez de criar um novo Drex a
+# cada operação: de -R$ 10,00 até R$ 100,00. Cada valor é criado no primeiro
+# uso e guardado em _INTERNADOS.
+CACHE_MIN_CENTAVOS = -1_000
+CACHE_MAX_CENTAVOS = 10_000
+
+
+def _para_centavos(valor) -> int:
+    if isinstance(valor, Drex):
+        return valor._centavos
+    if isinstance(valor, bool):
+        raise TypeError('Drex não aceita valores booleanos')
+    if isinstance(valor, int):
+        return valor * 100
+    if isinstance(valor, float):
+        # repr evita herdar o erro binário do float (ex.: 0.285 * 100 = 28.4999...)
+        return round(Decimal(repr(valor)) * 100)
+    if isinstance(valor, Fraction):
+        return round(valor * 100)
+    if isinstance(valor, (str, Decimal)):
+        return round(Decimal(valor) * 100)
+    raise TypeError(f'Valor inválido para Drex: {valor!r}')
+
+
+def _dividir(centavos: int, divisor: Numero) -> int:
+    # Arredondamento bancário (metade para o par) em todos os casos
+    if isinstance(divisor, int):
+        return round(Fraction(centavos, divisor))
+    if isinstance(divisor, Decimal):
+        return round(Decimal(centavos) / divisor)
+    return round(centavos / divisor)
+
+
+class Drex:
+    # Valor monetário em ponto fixo: guarda centavos inteiros e é imutável.
+    # Como o único campo é um int, o hash é o dele (barato de calcular a
+    # cada chamada), e criar um Drex é uma alocação mais uma escrita no slot.
+    __slots__ = ('_centavos',)
+
+    def __new__(cls, valor: Union[Numero, str, 'Drex'] = 0) -> 'Drex':
+        return cls.de_centavos(_para_centavos(valor))
+
+    @classmethod
+    def de_centavos(cls, centavos: int) -> 'Drex':
+        if cls is Drex:
+            return _de_centavos(centavos)
+        instancia = _alocar(cls)
+        _definir_centavos(instancia, centavos)
+        return instancia
+
+    @classmethod
+    def somar(cls, valores: Iterable['Drex']) -> 'Drex':
+        # Soma direto nos centavos, sem criar um Drex intermediário por parcela
+        return cls.de_centavos(sum(valor._centavos for valor in valores))
+
+    @property
+    def centavos(self) -> int:
+        return self._centavos
+
+    def __setattr__(self, nome, valor) -> None:
+        raise AttributeError('Drex é imutável')
+
+    def __delattr__(self, nome) -> None:
+        raise AttributeError('Drex é imutável')
+
+    def __reduce__(self):
+        return (Drex.de_centavos, (self._centavos,))
+
+    # Representação
+
+    def __str__(self) -> str:
+        sinal = '-' if self._centavos < 0 else ''
+        reais, resto = divmod(abs(self._centavos), 100)
+        return f'R$ {sinal}{reais}.{resto:02d}'
+
+    def __repr__(self) -> str:
+        sinal = '-' if self._centavos < 0 else ''
+        reais, resto = divmod(abs(self._centavos), 100)
+        return f"Drex('{sinal}{reais}.{resto:02d}')"
+
+    def __float__(self) -> float:
+        return self._centavos / 100
+
+    def __int__(self) -> int:
+        # Reais inteiros, truncando em direção a zero como int(float), mas
+        # sem passar por float (exato para qualquer quantidade de centavos)
+        reais = abs(self._centavos) // 100
+        return -reais if self._centavos < 0 else reais
+
+    def __bool__(self) -> bool:
+        return self._centavos > 0
+
+    def __hash__(self) -> int:
+        return hash(self._centavos)
+
+    # Aritmética
+
+    def __add__(self, x: 'Drex') -> 'Drex':
+        if not isinstance(x, Drex):
+            return NotImplemented
+        return _de_centavos(self._centavos + x._centavos)
+
+    def __radd__(self, x) -> 'Drex':
+        # Permite sum([...]), que começa somando com o inteiro 0
+        if x == 0 and isinstance(x, int):
+            return self
+        return NotImplemented
+
+    def __sub__(self, x: 'Drex') -> 'Drex':
+        if not isinstance(x, Drex):
+            return NotImplemented
+        return _de_centavos(self._centavos - x._centavos)
+
+    def __mul__(self, x: Numero) -> 'Drex':
+        if isinstance(x, int) and not isinstance(x, bool):
+            return _de_centavos(self._centavos * x)
+        if isinstance(x, (float, Decimal, Fraction)):
+            return _de_centavos(round(self._centavos * x))
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, x: Union[Numero, 'Drex']) -> Union['Drex', Fraction]:
+        if isinstance(x, Drex):
+            return Fraction(self._centavos, x._centavos)
+        if isinstance(x, (int, float, Decimal, Fraction)) and not isinstance(x, bool):
+            return _de_centavos(_dividir(self._centavos, x))
+        return NotImplemented
+
+    def __floordiv__(self, x: Union[int, 'Drex']) -> Union['Drex', int]:
+        if isinstance(x, Drex):
+            return self._centavos // x._centavos
+        if isinstance(x, int) and not isinstance(x, bool):
+            return _de_centavos(self._centavos // x)
+        return NotImplemented
+
+    def __mod__(self, x: 'Drex') -> 'Drex':
+        if not isinstance(x, Drex):
+            return NotImplemented
+        return _de_centavos(self._centavos % x._centavos)
+
+    def __divmod__(self, x: 'Drex'):
+        if not isinstance(x, Drex):
+            return NotImplemented
+        quociente, resto = divmod(self._centavos, x._centavos)
+        return quociente, _de_centavos(resto)
+
+    def __neg__(self) -> 'Drex':
+        return _de_centavos(-self._centavos)
+
+    def __pos__(self) -> 'Drex':
+        return self
+
+    def __abs__(self) -> 'Drex':
+        return self if self._centavos >= 0 else _de_centavos(-self._centavos)
+
+    # Comparação
+
+    def __eq__(self, x) -> bool:
+        if not isinstance(x, Drex):
+            return NotImplemented
+        return self._centavos == x._centavos
+
+    def __ne__(self, x) -> bool:
+        if not isinstance(x, Drex):
+            return NotImplemented
+        return self._centavos != x._centavos
+
+    def __lt__(self, x: 'Drex') -> bool:
+        if not isinstance(x, Drex):
+            return NotImplemented
+        return self._centavos < x._centavos
+
+    def __le__(self, x: 'Drex') -> bool:
+        if not isinstance(x, Drex):
+            return NotImplemented
+        return self._centavos <= x._centavos
+
+    def __gt__(self, x: 'Drex') -> bool:
+        if not isinstance(x, Drex):
+            return NotImplemented
+        return self._centavos > x._centavos
+
+    def __ge__(self, x: 'Drex') -> bool:
+        if not isinstance(x, Drex):
+            return NotImplemented
+        return self._centavos >= x._centavos
+
+
+_INTERNADOS: List[Optional[Drex]] = [None] * (CACHE_MAX_CENTAVOS - CACHE_MIN_CENTAVOS + 1)
+
+# Resolvidos uma vez: Drex.__setattr__ bloqueia atribuições, então o slot é
+# escrito direto pelo descritor
+_alocar = object.__new__
+_definir_centavos = Drex._centavos.__set__
+
+
+def _de_centavos(centavos: int) -> Drex:
+    # Drex.de_centavos para a própria classe Drex, sem o custo do classmethod
+    if CACHE_MIN_CENTAVOS <= centavos <= CACHE_MAX_CENTAVOS:
+        instancia = _INTERNADOS[centavos - CACHE_MIN_CENTAVOS]
+        if instancia is None:
+            instancia = _INTERNADOS[centavos - CACHE_MIN_CENTAVOS] = _alocar(Drex)
+            _definir_centavos(instancia, centavos)
+        return instancia
+    instancia = _alocar(Drex)
+    _definir_centavos(instancia, centavos)
+    return instancia
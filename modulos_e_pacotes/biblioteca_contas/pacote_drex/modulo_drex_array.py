@@ -0,0 +1,173 @@
+# Requer NumPy. Fica em um módulo separado para que `pacote_drex` continue
+# importável sem ele.
+
+from decimal import Decimal
+from fractions import Fraction
+from typing import Iterable, Iterator, List, Union
+
+import numpy as np
+
+from modulos_e_pacotes.biblioteca_contas.pacote_drex.modulo_drex import Drex
+
+
+class DrexArray:
+    # Vetor de valores Drex guardados como centavos em um np.ndarray int64.
+    # As operações são feitas de uma vez sobre o vetor inteiro, sem criar um
+    # Drex por elemento.
+    __slots__ = ('_centavos',)
+
+    __hash__ = None
+
+    def __init__(self, valores: Iterable[Drex] = ()) -> None:
+        self._centavos: np.ndarray = np.fromiter((valor.centavos for valor in valores), dtype=np.int64)
+
+    @classmethod
+    def de_centavos(cls, centavos) -> 'DrexArray':
+        instancia = cls.__new__(cls)
+        instancia._centavos = np.asarray(centavos, dtype=np.int64)
+        return instancia
+
+    @classmethod
+    def zeros(cls, tamanho: int) -> 'DrexArray':
+        return cls.de_centavos(np.zeros(tamanho, dtype=np.int64))
+
+    @property
+    def centavos(self) -> np.ndarray:
+        return self._centavos
+
+    def _operando(self, x):
+        if isinstance(x, DrexArray):
+            return x._centavos
+        if isinstance(x, Drex):
+            return x.centavos
+        return None
+
+    # Container
+
+    def __len__(self) -> int:
+        return len(self._centavos)
+
+    def __getitem__(self, indice) -> Union[Drex, 'DrexArray']:
+        resultado = self._centavos[indice]
+        if isinstance(resultado, np.ndarray):
+            return DrexArray.de_centavos(resultado)
+        return Drex.de_centavos(int(resultado))
+
+    def __setitem__(self, indice, valor: Union[Drex, 'DrexArray']) -> None:
+        centavos = self._operando(valor)
+        if centavos is None:
+            raise TypeError(f'Valor inválido para DrexArray: {valor!r}')
+        self._centavos[indice] = centavos
+
+    def __iter__(self) -> Iterator[Drex]:
+        for centavos in self._centavos.tolist():
+            yield Drex.de_centavos(centavos)
+
+    def para_lista(self) -> List[Drex]:
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f'DrexArray(tamanho={len(self)}, total={self.soma()})'
+
+    # Aritmética
+
+    def __add__(self, x: Union[Drex, 'DrexArray']) -> 'DrexArray':
+        centavos = self._operando(x)
+        if centavos is None:
+            return NotImplemented
+        return DrexArray.de_centavos(self._centavos + centavos)
+
+    __radd__ = __add__
+
+    def __sub__(self, x: Union[Drex, 'DrexArray']) -> 'DrexArray':
+        centavos = self._operando(x)
+        if centavos is None:
+            return NotImplemented
+        return DrexArray.de_centavos(self._centavos - centavos)
+
+    def __rsub__(self, x: Drex) -> 'DrexArray':
+        centavos = self._operando(x)
+        if centavos is None:
+            return NotImplemented
+        return DrexArray.de_centavos(centavos - self._centavos)
+
+    def __neg__(self) -> 'DrexArray':
+        return DrexArray.de_centavos(-self._centavos)
+
+    def __mul__(self, x) -> 'DrexArray':
+        if isinstance(x, (Drex, DrexArray, bool)):
+            return NotImplemented
+        if isinstance(x, int):
+            return DrexArray.de_centavos(self._centavos * x)
+        if isinstance(x, (Decimal, Fraction)):
+            x = float(x)
+        # np.rint arredonda metade para o par (arredondamento bancário)
+        return DrexArray.de_centavos(np.rint(self._centavos * np.asarray(x, dtype=np.float64)))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, x) -> 'DrexArray':
+        if isinstance(x, (Drex, DrexArray, bool)):
+            return NotImplemented
+        if isinstance(x, (Decimal, Fraction)):
+            x = float(x)
+        return DrexArray.de_centavos(np.rint(self._centavos / np.asarray(x, dtype=np.float64)))
+
+    # Comparação (retornam máscaras booleanas)
+
+    def __eq__(self, x) -> np.ndarray:
+        centavos = self._operando(x)
+        if centavos is None:
+            return NotImplemented
+        return self._centavos == centavos
+
+    def __ne__(self, x) -> np.ndarray:
+        centavos = self._operando(x)
+        if centavos is None:
+            return NotImplemented
+        return self._centavos != centavos
+
+    def __lt__(self, x) -> np.ndarray:
+        centavos = self._operando(x)
+        if centavos is None:
+            return NotImplemented
+        return self._centavos < centavos
+
+    def __le__(self, x) -> np.ndarray:
+        centavos = self._operando(x)
+        if centavos is None:
+            return NotImplemented
+        return self._centavos <= centavos
+
+    def __gt__(self, x) -> np.ndarray:
+        centavos = self._operando(x)
+        if centavos is None:
+            return NotImplemented
+        return self._centavos > centavos
+
+    def __ge__(self, x) -> np.ndarray:
+        centavos = self._operando(x)
+        if centavos is None:
+            return NotImplemented
+        return self._centavos >= centavos
+
+    # Agregações e máscaras
+
+    def soma(self) -> Drex:
+        return Drex.de_centavos(int(self._centavos.sum()))
+
+    def soma_acumulada(self) -> 'DrexArray':
+        return DrexArray.de_centavos(np.cumsum(self._centavos))
+
+    def minimo(self) -> Drex:
+        return Drex.de_centavos(int(self._centavos.min()))
+
+    def maximo(self) -> Drex:
+        return Drex.de_centavos(int(self._centavos.max()))
+
+    def onde(self, mascara: np.ndarray, senao: Union[Drex, 'DrexArray']) -> 'DrexArray':
+        # Mantém os valores onde a máscara é verdadeira e usa `senao` nos demais
+        centavos = self._operando(senao)
+        if centavos is None:
+            raise TypeError(f'Valor inválido para DrexArray: {senao!r}')
+        return DrexArray.de_centavos(np.where(mascara, self._centavos, centavos))
@@ -0,0 +1,12 @@
+from modulos_e_pacotes.biblioteca_contas._importacao_tardia import exportacoes_sob_demanda
+
+_EXPORTACOES = {
+    'Titular': '.modulo_titular',
+    'RegistroCpf': '.modulo_registro_cpf',
+    'cpf_valido': '.modulo_cpf',
+    'validar_cpfs': '.modulo_cpf',
+}
+
+__all__ = list(_EXPORTACOES)
+
+__getattr__, __dir__ = exportacoes_sob_demanda(__name__, _EXPORTACOES)
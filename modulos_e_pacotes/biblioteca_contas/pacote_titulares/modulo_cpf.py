@@ -0,0 +1,64 @@
+from functools import lru_cache
+from operator import mul
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Quantidade de CPFs lembrados por cpf_valido
+TAMANHO_CACHE = 1 << 16
+
+# validar_cpfs processa a matriz de dígitos em fatias deste número de linhas
+# para limitar a memória dos temporários.
+LINHAS_POR_FATIA = 1 << 20
+
+_PESOS = (10, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
+def digitos_verificadores(base: str) -> str:
+    # Os dois dígitos verificadores (módulo 11) dos 9 primeiros dígitos. Os
+    # pesos do segundo (11..3) são os do primeiro (10..2) mais um, então a
+    # segunda soma reaproveita a primeira.
+    digitos = list(map(int, base))
+    soma = sum(map(mul, digitos, _PESOS))
+    primeiro = soma * 10 % 11 % 10
+    segundo = (soma + sum(digitos) + primeiro * 2) * 10 % 11 % 10
+    return f'{primeiro}{segundo}'
+
+
+@lru_cache(maxsize=TAMANHO_CACHE)
+def cpf_valido(cpf: str) -> bool:
+    # 11 dígitos, nem todos iguais, e dígitos verificadores corretos
+    if len(cpf) != 11 or not cpf.isascii() or not cpf.isdigit() or cpf == cpf[0] * 11:
+        return False
+    return cpf[9:] == digitos_verificadores(cpf[:9])
+
+
+def validar_cpfs(cpfs: Sequence[str]) -> 'np.ndarray':
+    # Versão vetorizada de cpf_valido: retorna uma máscara booleana. Os CPFs
+    # viram uma matriz uint8 (uma linha por CPF, uma coluna por dígito) e os
+    # dígitos verificadores são calculados para todas as linhas de uma vez.
+    # Requer NumPy.
+    import numpy as np
+
+    quantidade = len(cpfs)
+    if any(len(cpf) != 11 for cpf in cpfs):
+        # Tamanho errado: troca por um valor inválido com 11 caracteres
+        cpfs = [cpf if len(cpf) == 11 else '?' * 11 for cpf in cpfs]
+    # 'replace' troca cada caractere não ASCII por um único '?', preservando
+    # as 11 posições de cada CPF
+    matriz = np.frombuffer(''.join(cpfs).encode('ascii', 'replace'), dtype=np.uint8).reshape(quantidade, 11)
+    pesos_primeiro = np.arange(10, 1, -1, dtype=np.int32)
+    pesos_segundo = np.arange(11, 1, -1, dtype=np.int32)
+    validos = np.empty(quantidade, dtype=bool)
+    for inicio in range(0, quantidade, LINHAS_POR_FATIA):
+        digitos = matriz[inicio:inicio + LINHAS_POR_FATIA] - np.uint8(48)  # fora de '0'..'9' passa de 9
+        primeiro = (digitos[:, :9] @ pesos_primeiro) * 10 % 11 % 10
+        segundo = (digitos[:, :9] @ pesos_segundo[:9] + primeiro * 2) * 10 % 11 % 10
+        validos[inicio:inicio + LINHAS_POR_FATIA] = (
+            (digitos <= 9).all(axis=1)
+            & (digitos != digitos[:, :1]).any(axis=1)
+            & (digitos[:, 9] == primeiro)
+            & (digitos[:, 10] == segundo)
+        )
+    return validos
@@ -0,0 +1,90 @@
+from typing import Iterable, Iterator, List, Set
+
+
+class RegistroCpf:
+    # Registro de CPFs baseado em set: adicionar, consultar e remover são O(1).
+    # Opcionalmente os CPFs são distribuídos em "shards" pelo prefixo do CPF,
+    # o que mantém cada set menor e permite percorrer o registro por faixa.
+    def __init__(self, digitos_prefixo: int = 0) -> None:
+        if digitos_prefixo < 0 or digitos_prefixo > 3:
+            raise ValueError('digitos_prefixo deve estar entre 0 e 3')
+        self._digitos_prefixo: int = digitos_prefixo
+        self._shards: List[Set[str]] = [set() for _ in range(10 ** digitos_prefixo)]
+        self._quantidade: int = 0
+
+    def _shard(self, cpf: str) -> Set[str]:
+        if not self._digitos_prefixo:
+            return self._shards[0]
+        prefixo = cpf[:self._digitos_prefixo]
+        if len(prefixo) == self._digitos_prefixo and prefixo.isdigit():
+            return self._shards[int(prefixo)]
+        # CPFs fora do formato numérico ficam no primeiro shard
+        return self._shards[0]
+
+    @property
+    def digitos_prefixo(self) -> int:
+        return self._digitos_prefixo
+
+    def adicionar(self, cpf: str) -> bool:
+        shard = self._shard(cpf)
+        if cpf in shard:
+            return False
+        shard.add(cpf)
+        self._quantidade += 1
+        return True
+
+    def contem(self, cpf: str) -> bool:
+        return cpf in self._shard(cpf)
+
+    def remover(self, cpf: str) -> bool:
+        shard = self._shard(cpf)
+        if cpf not in shard:
+            return False
+        shard.remove(cpf)
+        self._quantidade -= 1
+        return True
+
+    def carregar_em_lote(self, cpfs: Iterable[str]) -> int:
+        # Retorna quantos CPFs eram novos no registro
+        if not self._digitos_prefixo:
+            shard = self._shards[0]
+            antes = len(shard)
+            shard.update(cpfs)
+            adicionados = len(shard) - antes
+        else:
+            adicionados = 0
+            for cpf in cpfs:
+                shard = self._shard(cpf)
+                if cpf not in shard:
+                    shard.add(cpf)
+                    adicionados += 1
+        self._quantidade += adicionados
+        return adicionados
+
+    def listar(self, prefixo: str = '') -> Iterator[str]:
+        # Gera os CPFs sob demanda, sem montar uma lista com todo o registro
+        if self._digitos_prefixo and len(prefixo) >= self._digitos_prefixo and prefixo[:self._digitos_prefixo].isdigit():
+            shards = [self._shard(prefixo)]
+        else:
+            shards = self._shards
+        for shard in shards:
+            for cpf in shard:
+                if cpf.startswith(prefixo):
+                    yield cpf
+
+    def limpar(self) -> None:
+        for shard in self._shards:
+            shard.clear()
+        self._quantidade = 0
+
+    def __contains__(self, cpf: str) -> bool:
+        return self.contem(cpf)
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    def __iter__(self) -> Iterator[str]:
+        return self.listar()
+
+    def __repr__(self) -> str:
+        return f'RegistroCpf(digitos_prefixo={self._digitos_prefixo}, quantidade={self._quantidade})'
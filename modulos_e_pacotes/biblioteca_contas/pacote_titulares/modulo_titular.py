@@ -1,6 +1,8 @@
 from datetime import date
 
 class Titular:
+    __slots__ = ('_nome', '_cpf', '_dt_nasc')
+
     def __init__(self, nome: str, cpf: str, dt_nasc: date) -> None:
         self._nome: str = nome
         self._cpf: str = cpf